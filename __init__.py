@@ -5,7 +5,11 @@ This package provides a system for breaking down Annual Operating Plan (AOP) Tar
 into actionable timeframes for Group Learning Directors (GLDs).
 """
 
-from aop_target_agent.aop_target_agent import run_aop_target_agent
+from aop_target_agent.aop_target_agent import (
+    run_aop_target_agent,
+    run_aop_target_agent_batch,
+    run_many
+)
 
 __version__ = "0.1.0"
-__all__ = ["run_aop_target_agent"]
+__all__ = ["run_aop_target_agent", "run_aop_target_agent_batch", "run_many"]
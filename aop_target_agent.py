@@ -13,24 +13,23 @@ and opportunity recommendations.
 import os
 import sys
 import json
-import yaml
-from typing import List, Dict, Any, Optional
+import time
+import logging
+import asyncio
+import threading
+import calendar
+import concurrent.futures
+import functools
+import orjson
+import numpy as np
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
-
-# Import crewAI components
-from crewai import Agent, Task, Crew, LLM
-
-# Import local modules
-from .models import (
-    AOPTarget, 
-    LearningPlan, 
-    RiskAssessment, 
-    Opportunity, 
-    DiagnosticReport,
-    TimeframeTasks,
-    TargetBreakdown
-)
+
+# Import local modules. crewAI (and the tools and LLM wrappers built on it)
+# pulls in LangChain, litellm and friends, so it is imported lazily in
+# create_agents() to keep import time low for callers that never build a crew.
 from .data_sources import (
     get_learning_plan_data,
     get_ievolve_data,
@@ -38,43 +37,108 @@ from .data_sources import (
     get_aftd_data,
     get_internal_internship_data
 )
-from .tools import (
-    analyze_learning_plan,
-    calculate_gap,
-    assess_risk,
-    identify_opportunities,
-    generate_diagnostic_report,
-    breakdown_targets
-)
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional and not available on Windows
+    uvloop = None
+
+if TYPE_CHECKING:
+    from crewai import Crew
+
+logger = logging.getLogger(__name__)
+
+# Recent per-stage timings, newest last
+_TRACES = deque(maxlen=256)
+
+@contextmanager
+def stage(name, traces=_TRACES, **metadata):
+    """Record how long the enclosed block takes as a trace entry"""
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        traces.append({
+            "stage": name,
+            "duration_ms": (time.perf_counter_ns() - start) / 1e6,
+            "metadata": metadata
+        })
+
+def get_recent_traces():
+    """Return the recent stage timings as a JSON string"""
+    return json.dumps(list(_TRACES))
 
 # Load configuration
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load agent and task configurations from YAML files"""
+    """Load agent and task configurations from YAML files.
+
+    The configuration is static, so it is parsed once per process and the
+    cached result is returned on subsequent calls. Callers must treat the
+    returned dictionaries as read-only.
+    """
+    import yaml
+    
     config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     
     configs = {}
     for config_type in ["agents", "tasks"]:
         config_path = os.path.join(config_dir, f"{config_type}.yaml")
         try:
             with open(config_path, "r") as file:
-                configs[config_type] = yaml.safe_load(file)
+                configs[config_type] = yaml.load(file, Loader=loader)
         except FileNotFoundError:
-            print(f"Warning: Configuration file {config_path} not found.")
+            logger.warning("Configuration file %s not found.", config_path)
             configs[config_type] = {}
     
     return configs.get("agents", {}), configs.get("tasks", {})
 
+# Appended to every task description when several targets share one kickoff;
+# {batch_manifest} is interpolated from the kickoff inputs
+_BATCH_INSTRUCTIONS = (
+    " Produce answers for each of the following indexed AOP targets and return"
+    " a JSON array with one entry per target, in index order: {batch_manifest}"
+)
+
 # Create agents
-def create_agents(mock_mode=True):
-    """Create the agent system for AOP target breakdown"""
+def create_agents(mock_mode=True, batch=False, verbose=False):
+    """Create the agent system for AOP target breakdown.
+
+    With ``batch`` set, every task is asked to answer for all targets listed
+    in the ``batch_manifest`` input at once. ``verbose`` turns on crewAI's
+    step-by-step console output, which is off by default because it prints
+    on every LLM turn.
+    """
+    from crewai import Agent, Task, Crew
+    
+    from .tools import (
+        analyze_learning_plan,
+        calculate_gap,
+        assess_risk,
+        identify_opportunities,
+        generate_diagnostic_report,
+        breakdown_targets
+    )
+    from .llm import MockLLM, build_llm, configure_http_clients
     
     # Load agent and task configurations
     agents_config, tasks_config = load_config()
     
-    # Initialize LLM with mock mode for testing
-    llm = LLM(mock=mock_mode)
+    if mock_mode:
+        # Never reach a provider in mock mode, even when API keys are set
+        llm = MockLLM()
+    else:
+        # Reuse pooled keep-alive connections for every real model call
+        configure_http_clients()
+        # Deterministic responses are cached so repeated runs over the same
+        # inputs skip the model call, and transient provider failures fall
+        # through to cheaper fallback models
+        llm = build_llm()
     
-    print("Creating AOP Target Breakdown Agent System...")
+    logger.info("Creating AOP Target Breakdown Agent System...")
     
     # Create Target Breakdown Agent
     target_breakdown_agent = Agent(
@@ -83,7 +147,7 @@ def create_agents(mock_mode=True):
         backstory="As a specialist in operational planning, you excel at breaking down annual targets into actionable timeframes that make large goals achievable.",
         llm=llm,
         tools=[breakdown_targets],
-        verbose=True
+        verbose=verbose
     )
     
     # Create Learning Plan Analysis Agent
@@ -93,7 +157,7 @@ def create_agents(mock_mode=True):
         backstory="With expertise in learning and development metrics, you specialize in analyzing learning plans and identifying gaps in training delivery.",
         llm=llm,
         tools=[analyze_learning_plan, calculate_gap],
-        verbose=True
+        verbose=verbose
     )
     
     # Create Risk Assessment Agent
@@ -103,7 +167,7 @@ def create_agents(mock_mode=True):
         backstory="Your background in risk management allows you to identify potential issues in learning plan execution before they become problems.",
         llm=llm,
         tools=[assess_risk],
-        verbose=True
+        verbose=verbose
     )
     
     # Create Opportunity Identification Agent
@@ -113,7 +177,7 @@ def create_agents(mock_mode=True):
         backstory="You have a talent for spotting patterns in learning data and translating them into actionable opportunities for improvement.",
         llm=llm,
         tools=[identify_opportunities],
-        verbose=True
+        verbose=verbose
     )
     
     # Create Diagnostic Report Agent
@@ -123,45 +187,52 @@ def create_agents(mock_mode=True):
         backstory="Your analytical skills allow you to create insightful diagnostic reports that help leaders make informed decisions about learning initiatives.",
         llm=llm,
         tools=[generate_diagnostic_report],
-        verbose=True
+        verbose=verbose
     )
     
     # Create tasks
+    batch_suffix = _BATCH_INSTRUCTIONS if batch else ""
+    
     target_breakdown_task = Task(
-        description="Break down the annual AOP targets into quarterly, monthly, weekly, and daily to-do lists that are realistic and achievable.",
+        description="Break down the annual AOP targets into quarterly, monthly, weekly, and daily to-do lists that are realistic and achievable." + batch_suffix,
         expected_output="A structured breakdown of AOP targets across different timeframes with specific action items.",
         agent=target_breakdown_agent
     )
     
     learning_plan_task = Task(
-        description="Analyze the learning plan to identify the number of VILTs and ILTs scheduled and determine if there are any gaps in meeting targets.",
+        description="Analyze the learning plan to identify the number of VILTs and ILTs scheduled and determine if there are any gaps in meeting targets." + batch_suffix,
         expected_output="A detailed analysis of the learning plan with gap indicators (0 = No Gap) for each target area.",
         agent=learning_plan_agent,
         context=[target_breakdown_task]
     )
     
+    # Risk assessment and opportunity identification only depend on the
+    # learning plan analysis, so they run concurrently and the diagnostic
+    # task waits for both
     risk_assessment_task = Task(
-        description="Identify risk factors when GLD schedules, offering registrations, and closure ratios don't match the desired numbers for AOP targets.",
+        description="Identify risk factors when GLD schedules, offering registrations, and closure ratios don't match the desired numbers for AOP targets." + batch_suffix,
         expected_output="A risk assessment report highlighting areas where targets may be missed and the severity of each risk.",
         agent=risk_assessment_agent,
-        context=[target_breakdown_task, learning_plan_task]
+        context=[target_breakdown_task, learning_plan_task],
+        async_execution=True
     )
     
     opportunity_task = Task(
-        description="Analyze learning data trends to identify opportunities for meeting AOP targets more effectively.",
+        description="Analyze learning data trends to identify opportunities for meeting AOP targets more effectively." + batch_suffix,
         expected_output="A list of specific opportunities with quantifiable impacts, such as 'If you schedule 3 XYZ Bootcamp, you can meet your goal of ABC LH & DEF Competency'.",
         agent=opportunity_agent,
-        context=[learning_plan_task, risk_assessment_task]
+        context=[learning_plan_task],
+        async_execution=True
     )
     
     diagnostic_task = Task(
-        description="Generate diagnostic reports for Leaders and TD on skills strengths, weaknesses, and future risks based on all available data.",
+        description="Generate diagnostic reports for Leaders and TD on skills strengths, weaknesses, and future risks based on all available data." + batch_suffix,
         expected_output="Comprehensive diagnostic reports that provide actionable insights for leadership decision-making.",
         agent=diagnostic_agent,
         context=[learning_plan_task, risk_assessment_task, opportunity_task]
     )
     
-    # Create crew
+    # Create crew (sequential process; the async tasks above overlap)
     crew = Crew(
         agents=[
             target_breakdown_agent,
@@ -177,63 +248,243 @@ def create_agents(mock_mode=True):
             opportunity_task,
             diagnostic_task
         ],
-        verbose=True
+        verbose=verbose
     )
     
     return crew
 
+# Assembled crew definitions, keyed by (mock_mode, batch, verbose). A crew keeps
+# task outputs from its last kickoff, so callers kick off a copy() rather than
+# the cached crew itself.
+_CREW_CACHE: Dict[tuple, "Crew"] = {}
+_CREW_CACHE_LOCK = threading.Lock()
+
+def get_crew(mock_mode=True, batch=False, verbose=False):
+    """Return the cached crew definition for the given mode, creating it on first use"""
+    key = (mock_mode, batch, verbose)
+    with _CREW_CACHE_LOCK:
+        crew = _CREW_CACHE.get(key)
+        if crew is None:
+            with stage("create_agents", mock_mode=mock_mode, batch=batch):
+                crew = _CREW_CACHE[key] = create_agents(mock_mode=mock_mode, batch=batch, verbose=verbose)
+    return crew
+
+def reset_crew_cache():
+    """Drop all cached crews so the next run rebuilds them"""
+    with _CREW_CACHE_LOCK:
+        _CREW_CACHE.clear()
+
+def _timed_fetch(fetch):
+    """Call a data source, recording its duration under its function name"""
+    with stage(fetch.__name__):
+        return fetch()
+
+async def _fetch_all():
+    """Fetch all data sources concurrently, one worker thread per source"""
+    return await asyncio.gather(
+        asyncio.to_thread(_timed_fetch, get_learning_plan_data),
+        asyncio.to_thread(_timed_fetch, get_ievolve_data),
+        asyncio.to_thread(_timed_fetch, get_iglance_data),
+        asyncio.to_thread(_timed_fetch, get_aftd_data),
+        asyncio.to_thread(_timed_fetch, get_internal_internship_data)
+    )
+
+async def _prepare_inputs_async(aop_targets):
+    """Build the crew kickoff inputs for the given targets"""
+    
+    # The data sources are independent, so fetch them concurrently
+    (
+        learning_plan_data,
+        ievolve_data,
+        iglance_data,
+        aftd_data,
+        internal_internship_data
+    ) = await _fetch_all()
+    
+    return {
+        'aop_targets': aop_targets,
+        'current_date': datetime.now().strftime("%Y-%m-%d"),
+        'learning_plan_data': learning_plan_data,
+        'ievolve_data': ievolve_data,
+        'iglance_data': iglance_data,
+        'aftd_data': aftd_data,
+        'internal_internship_data': internal_internship_data
+    }
+
+def _run_async(coro):
+    """Run a coroutine to completion, on a uvloop event loop when available.
+
+    When the caller already has a running event loop (Jupyter, async web
+    servers), the coroutine gets a fresh loop in a worker thread instead.
+    """
+    run = uvloop.run if uvloop is not None else asyncio.run
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run(coro)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run, coro).result()
+
+def _prepare_inputs(aop_targets):
+    """Synchronous wrapper around _prepare_inputs_async()"""
+    return _run_async(_prepare_inputs_async(aop_targets))
+
+def _validate_targets(aop_targets):
+    """Validate raw AOP targets once, returning a frozen AOPTarget"""
+    from .models import AOPTarget
+    
+    if isinstance(aop_targets, AOPTarget):
+        return aop_targets
+    return AOPTarget.model_validate(aop_targets)
+
 # Main function to run the agent
-def run_aop_target_agent(aop_targets, mock_mode=True):
+def run_aop_target_agent(aop_targets, mock_mode=True, verbose=False):
     """Run the AOP Target Breakdown Agent system"""
     
-    print("Starting AOP Target Breakdown Analysis...")
+    logger.info("Starting AOP Target Breakdown Analysis...")
     
-    # Create crew
-    crew = create_agents(mock_mode=mock_mode)
+    # Reject malformed targets before any work is done
+    aop_targets = _validate_targets(aop_targets)
+    
+    # Mock mode answers without building a crew or calling a model
+    if mock_mode:
+        return generate_mock_results(aop_targets)
+    
+    # Reuse the crew definition built by a previous run when available
+    crew = get_crew(mock_mode=mock_mode, verbose=verbose)
     
     # Prepare input data
-    input_data = {
-        'aop_targets': aop_targets,
-        'current_date': datetime.now().strftime("%Y-%m-%d"),
-        'learning_plan_data': get_learning_plan_data(),
-        'ievolve_data': get_ievolve_data(),
-        'iglance_data': get_iglance_data(),
-        'aftd_data': get_aftd_data(),
-        'internal_internship_data': get_internal_internship_data()
-    }
+    input_data = _prepare_inputs(aop_targets.model_dump())
     
     # Run the crew
-    print("Starting the crew analysis process...")
+    logger.info("Starting the crew analysis process...")
     try:
-        result = crew.kickoff(inputs=input_data)
-        print("AOP Target Breakdown Analysis complete!")
+        with stage("crew.kickoff"):
+            result = crew.copy().kickoff(inputs=input_data)
+        logger.info("AOP Target Breakdown Analysis complete!")
         return result
     except Exception as e:
-        print(f"Error during crew execution: {e}")
+        logger.error("Error during crew execution: %s", e)
         # Return mock results for demonstration
         return generate_mock_results(aop_targets)
 
+async def run_many(targets, concurrency=8, mock_mode=True, verbose=False):
+    """Run the agent system for many AOP targets concurrently.
+
+    Data sources are fetched once and shared by every run. Each target gets
+    its own copy of the cached crew, because a crew keeps task outputs from
+    its last kickoff, and at most ``concurrency`` kickoffs are in flight at
+    a time to stay within provider rate limits.
+    """
+    
+    logger.info("Starting concurrent AOP Target Breakdown Analysis for %d targets...", len(targets))
+    
+    targets = [_validate_targets(aop_targets) for aop_targets in targets]
+    if mock_mode:
+        return list(iter_mock_results(targets))
+    
+    crew = get_crew(mock_mode=mock_mode, verbose=verbose)
+    base_inputs = await _prepare_inputs_async(None)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _run_one(aop_targets):
+        async with semaphore:
+            try:
+                with stage("crew.kickoff_async"):
+                    return await crew.copy().kickoff_async(inputs=dict(base_inputs, aop_targets=aop_targets.model_dump()))
+            except Exception as e:
+                logger.error("Error during crew execution: %s", e)
+                # Return mock results for demonstration
+                return generate_mock_results(aop_targets)
+    
+    results = await asyncio.gather(*(_run_one(aop_targets) for aop_targets in targets))
+    logger.info("Concurrent AOP Target Breakdown Analysis complete!")
+    return results
+
+def _batch_manifest(targets):
+    """Render targets as an indexed manifest: [0]={...} [1]={...}"""
+    return " ".join(f"[{i}]={json.dumps(target, sort_keys=True)}" for i, target in enumerate(targets))
+
+def _demux_batch_output(raw, count):
+    """Split a batched crew answer into one result per target.
+
+    Accepts either a JSON array in index order or a JSON object keyed by
+    index (``"0"`` or ``"[0]"``). Raises ValueError if an answer is missing.
+    """
+    parsed = json.loads(raw)
+    if isinstance(parsed, dict):
+        parsed = [parsed.get(str(i), parsed.get(f"[{i}]")) for i in range(count)]
+    if not isinstance(parsed, list) or len(parsed) != count or any(r is None for r in parsed):
+        raise ValueError(f"Expected {count} batched answers, got {raw[:200]!r}")
+    return parsed
+
+def run_aop_target_agent_batch(targets, batch_size=8, mock_mode=True, verbose=False):
+    """Run the agent system over many AOP targets, several per kickoff.
+
+    Targets are grouped into batches of ``batch_size`` and each batch is
+    answered by a single crew kickoff, so N targets cost N / batch_size
+    kickoffs instead of N. Returns one entry per target, in the order of
+    ``targets``: the target's parsed answer, or None when its batch failed.
+    """
+    
+    logger.info("Starting batched AOP Target Breakdown Analysis for %d targets...", len(targets))
+    
+    targets = [_validate_targets(aop_targets).model_dump() for aop_targets in targets]
+    if mock_mode:
+        return list(iter_mock_results(targets))
+    
+    crew = get_crew(mock_mode=mock_mode, batch=True, verbose=verbose)
+    input_data = _prepare_inputs(targets)
+    
+    results = []
+    for start in range(0, len(targets), batch_size):
+        batch = targets[start:start + batch_size]
+        inputs = dict(input_data, aop_targets=batch, batch_manifest=_batch_manifest(batch))
+        try:
+            with stage("crew.kickoff", batch_size=len(batch)):
+                output = crew.copy().kickoff(inputs=inputs)
+            results.extend(_demux_batch_output(getattr(output, "raw", output), len(batch)))
+        except Exception as e:
+            logger.error("Error during batched crew execution for targets %d-%d: %s", start, start + len(batch) - 1, e)
+            results.extend([None] * len(batch))
+    
+    logger.info("Batched AOP Target Breakdown Analysis complete!")
+    return results
+
+# Share of the annual targets allocated to each period in mock results
+_QUARTER_WEIGHTS = np.array([0.2, 0.3, 0.3, 0.2])
+_QUARTER_LABELS = ("Q1", "Q2", "Q3", "Q4")
+_MONTH_WEIGHTS = np.array([0.07, 0.07, 0.06, 0.08, 0.09, 0.13, 0.09, 0.08, 0.09, 0.08, 0.08, 0.08])
+_MONTH_LABELS = tuple(calendar.month_name[1:13])
+_WEEK_WEIGHTS = np.full(52, 1 / 52)
+_WEEK_LABELS = tuple(f"Week {i}" for i in range(1, 53))
+
 def generate_mock_results(aop_targets):
     """Generate mock results for demonstration purposes"""
     
-    # Mock target breakdown
+    targets = _validate_targets(aop_targets)
+    
+    # Mock target breakdown; each period's targets are the annual targets
+    # scaled by a weight, computed for all periods at once
+    annual = np.array([targets.vilt_target, targets.ilt_target], dtype=float)
+    quarterly = np.outer(_QUARTER_WEIGHTS, annual).tolist()
+    monthly = np.outer(_MONTH_WEIGHTS, annual).tolist()
+    weekly = np.outer(_WEEK_WEIGHTS, annual).tolist()
+    
     target_breakdown = {
-        "annual": aop_targets,
+        "annual": targets.model_dump(),
         "quarterly": [
-            {"quarter": "Q1", "vilt_target": aop_targets["vilt_target"] * 0.2, "ilt_target": aop_targets["ilt_target"] * 0.2},
-            {"quarter": "Q2", "vilt_target": aop_targets["vilt_target"] * 0.3, "ilt_target": aop_targets["ilt_target"] * 0.3},
-            {"quarter": "Q3", "vilt_target": aop_targets["vilt_target"] * 0.3, "ilt_target": aop_targets["ilt_target"] * 0.3},
-            {"quarter": "Q4", "vilt_target": aop_targets["vilt_target"] * 0.2, "ilt_target": aop_targets["ilt_target"] * 0.2}
+            {"quarter": name, "vilt_target": vilt, "ilt_target": ilt}
+            for name, (vilt, ilt) in zip(_QUARTER_LABELS, quarterly)
         ],
         "monthly": [
-            {"month": "January", "vilt_target": aop_targets["vilt_target"] * 0.07, "ilt_target": aop_targets["ilt_target"] * 0.07},
-            {"month": "February", "vilt_target": aop_targets["vilt_target"] * 0.07, "ilt_target": aop_targets["ilt_target"] * 0.07},
-            # Additional months would be included here
+            {"month": name, "vilt_target": vilt, "ilt_target": ilt}
+            for name, (vilt, ilt) in zip(_MONTH_LABELS, monthly)
         ],
         "weekly": [
-            {"week": "Week 1", "vilt_target": aop_targets["vilt_target"] * 0.02, "ilt_target": aop_targets["ilt_target"] * 0.02},
-            {"week": "Week 2", "vilt_target": aop_targets["vilt_target"] * 0.02, "ilt_target": aop_targets["ilt_target"] * 0.02},
-            # Additional weeks would be included here
+            {"week": name, "vilt_target": vilt, "ilt_target": ilt}
+            for name, (vilt, ilt) in zip(_WEEK_LABELS, weekly)
         ],
         "daily": [
             {"day": "Monday", "tasks": ["Schedule 2 VILT sessions", "Review 1 ILT curriculum"]},
@@ -244,12 +495,12 @@ def generate_mock_results(aop_targets):
     
     # Mock gap analysis
     gap_analysis = {
-        "vilt_scheduled": aop_targets["vilt_target"] * 0.8,
-        "vilt_gap": aop_targets["vilt_target"] * 0.2,
-        "vilt_gap_indicator": 0 if aop_targets["vilt_target"] * 0.8 >= aop_targets["vilt_target"] else aop_targets["vilt_target"] * 0.2,
-        "ilt_scheduled": aop_targets["ilt_target"] * 0.7,
-        "ilt_gap": aop_targets["ilt_target"] * 0.3,
-        "ilt_gap_indicator": 0 if aop_targets["ilt_target"] * 0.7 >= aop_targets["ilt_target"] else aop_targets["ilt_target"] * 0.3
+        "vilt_scheduled": targets.vilt_target * 0.8,
+        "vilt_gap": targets.vilt_target * 0.2,
+        "vilt_gap_indicator": 0 if targets.vilt_target * 0.8 >= targets.vilt_target else targets.vilt_target * 0.2,
+        "ilt_scheduled": targets.ilt_target * 0.7,
+        "ilt_gap": targets.ilt_target * 0.3,
+        "ilt_gap_indicator": 0 if targets.ilt_target * 0.7 >= targets.ilt_target else targets.ilt_target * 0.3
     }
     
     # Mock risk assessment
@@ -321,8 +572,28 @@ def generate_mock_results(aop_targets):
         "diagnostic_report": diagnostic_report
     }
 
+def iter_mock_results(targets):
+    """Lazily generate mock results for many AOP targets, one at a time"""
+    for aop_targets in targets:
+        yield generate_mock_results(aop_targets)
+
+def write_results_json(results, file):
+    """Stream an iterable of results to a binary file as a JSON array.
+
+    Only one result is held in memory at a time, so pairing this with
+    iter_mock_results() keeps peak memory flat for large batches.
+    """
+    file.write(b"[")
+    for i, result in enumerate(results):
+        if i:
+            file.write(b",")
+        file.write(orjson.dumps(result))
+    file.write(b"]")
+
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Example AOP targets
     aop_targets = {
         "vilt_target": 500,  # Number of VILT sessions for the year
@@ -339,5 +610,5 @@ if __name__ == "__main__":
     result = run_aop_target_agent(aop_targets, mock_mode=True)
     
     # Print the results
-    print("\nAOP Target Breakdown Results:")
-    print(json.dumps(result, indent=2))
+    print("\nAOP Target Breakdown Results:", flush=True)
+    sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
@@ -7,10 +7,11 @@ This app provides a user-friendly interface for interacting with the agent syste
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import json
+import numpy as np
+import io
+import csv
+import orjson
+import functools
 import sys
 import os
 from datetime import datetime
@@ -18,49 +19,79 @@ from datetime import datetime
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Share of the annual targets allocated to each period in the mock breakdown
+_QUARTER_RATIOS = np.array([0.2, 0.3, 0.3, 0.2])
+_QUARTER_NAMES = ("Q1", "Q2", "Q3", "Q4")
+_MONTH_RATIOS = np.array([0.07, 0.07, 0.06, 0.08, 0.09, 0.13, 0.09, 0.08, 0.09, 0.08, 0.08, 0.08])
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+_WEEK_RATIOS = np.full(4, 0.02)
+_WEEK_NAMES = ("Week 1", "Week 2", "Week 3", "Week 4")
+_COMP_SCHED_RATIO = {"technical": 0.75, "soft_skills": 0.85, "leadership": 0.65}
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+
+# Weekly and daily to-do lists only differ in their first item
+_WEEKLY_TASK_TEMPLATE = (
+    "Confirm trainers for {w} sessions",
+    "Send reminders to registered participants",
+    "Prepare training materials and environments",
+    "Review feedback from previous week's sessions"
+)
+_DAILY_TASK_TEMPLATE = (
+    "Review {d}'s scheduled sessions",
+    "Check registration numbers for upcoming sessions",
+    "Follow up on participant feedback",
+    "Update tracking dashboards",
+    "Coordinate with trainers and support staff"
+)
+
 # Define functions to generate mock data directly in the app
-def generate_mock_results(aop_targets):
+def generate_mock_results(aop_targets, report_date=None):
     """Generate mock results for demonstration purposes"""
+    if report_date is None:
+        report_date = datetime.now().strftime("%Y-%m-%d")
+    
+    # Mock target breakdown; every period is the annual VILT/ILT targets
+    # scaled by that period's ratio, computed in one multiply per section
+    annual = [aop_targets["vilt_target"], aop_targets["ilt_target"]]
+    quarterly = np.outer(_QUARTER_RATIOS, annual).tolist()
+    monthly = np.outer(_MONTH_RATIOS, annual).tolist()
+    weekly = np.outer(_WEEK_RATIOS, annual).tolist()
     
-    # Mock target breakdown
     target_breakdown = {
         "annual": aop_targets,
         "quarterly": [
-            {"quarter": "Q1", "vilt_target": aop_targets["vilt_target"] * 0.2, "ilt_target": aop_targets["ilt_target"] * 0.2},
-            {"quarter": "Q2", "vilt_target": aop_targets["vilt_target"] * 0.3, "ilt_target": aop_targets["ilt_target"] * 0.3},
-            {"quarter": "Q3", "vilt_target": aop_targets["vilt_target"] * 0.3, "ilt_target": aop_targets["ilt_target"] * 0.3},
-            {"quarter": "Q4", "vilt_target": aop_targets["vilt_target"] * 0.2, "ilt_target": aop_targets["ilt_target"] * 0.2}
+            {"quarter": name, "vilt_target": vilt, "ilt_target": ilt}
+            for name, (vilt, ilt) in zip(_QUARTER_NAMES, quarterly)
         ],
         "monthly": [
-            {"month": "January", "vilt_target": aop_targets["vilt_target"] * 0.07, "ilt_target": aop_targets["ilt_target"] * 0.07},
-            {"month": "February", "vilt_target": aop_targets["vilt_target"] * 0.07, "ilt_target": aop_targets["ilt_target"] * 0.07},
-            {"month": "March", "vilt_target": aop_targets["vilt_target"] * 0.06, "ilt_target": aop_targets["ilt_target"] * 0.06},
-            {"month": "April", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "May", "vilt_target": aop_targets["vilt_target"] * 0.09, "ilt_target": aop_targets["ilt_target"] * 0.09},
-            {"month": "June", "vilt_target": aop_targets["vilt_target"] * 0.13, "ilt_target": aop_targets["ilt_target"] * 0.13},
-            {"month": "July", "vilt_target": aop_targets["vilt_target"] * 0.09, "ilt_target": aop_targets["ilt_target"] * 0.09},
-            {"month": "August", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "September", "vilt_target": aop_targets["vilt_target"] * 0.09, "ilt_target": aop_targets["ilt_target"] * 0.09},
-            {"month": "October", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "November", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "December", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08}
+            {"month": name, "vilt_target": vilt, "ilt_target": ilt}
+            for name, (vilt, ilt) in zip(_MONTH_NAMES, monthly)
         ],
         "weekly": [
-            {"week": "Week 1", "vilt_target": aop_targets["vilt_target"] * 0.02, "ilt_target": aop_targets["ilt_target"] * 0.02, "tasks": ["Confirm trainers for Week 1 sessions", "Send reminders to registered participants", "Prepare training materials and environments", "Review feedback from previous week's sessions"]},
-            {"week": "Week 2", "vilt_target": aop_targets["vilt_target"] * 0.02, "ilt_target": aop_targets["ilt_target"] * 0.02, "tasks": ["Confirm trainers for Week 2 sessions", "Send reminders to registered participants", "Prepare training materials and environments", "Review feedback from previous week's sessions"]},
-            {"week": "Week 3", "vilt_target": aop_targets["vilt_target"] * 0.02, "ilt_target": aop_targets["ilt_target"] * 0.02, "tasks": ["Confirm trainers for Week 3 sessions", "Send reminders to registered participants", "Prepare training materials and environments", "Review feedback from previous week's sessions"]},
-            {"week": "Week 4", "vilt_target": aop_targets["vilt_target"] * 0.02, "ilt_target": aop_targets["ilt_target"] * 0.02, "tasks": ["Confirm trainers for Week 4 sessions", "Send reminders to registered participants", "Prepare training materials and environments", "Review feedback from previous week's sessions"]}
+            {"week": name, "vilt_target": vilt, "ilt_target": ilt,
+             "tasks": [_WEEKLY_TASK_TEMPLATE[0].format(w=name), *_WEEKLY_TASK_TEMPLATE[1:]]}
+            for name, (vilt, ilt) in zip(_WEEK_NAMES, weekly)
         ],
         "daily": [
-            {"day": "Monday", "tasks": ["Review Monday's scheduled sessions", "Check registration numbers for upcoming sessions", "Follow up on participant feedback", "Update tracking dashboards", "Coordinate with trainers and support staff"]},
-            {"day": "Tuesday", "tasks": ["Review Tuesday's scheduled sessions", "Check registration numbers for upcoming sessions", "Follow up on participant feedback", "Update tracking dashboards", "Coordinate with trainers and support staff"]},
-            {"day": "Wednesday", "tasks": ["Review Wednesday's scheduled sessions", "Check registration numbers for upcoming sessions", "Follow up on participant feedback", "Update tracking dashboards", "Coordinate with trainers and support staff"]},
-            {"day": "Thursday", "tasks": ["Review Thursday's scheduled sessions", "Check registration numbers for upcoming sessions", "Follow up on participant feedback", "Update tracking dashboards", "Coordinate with trainers and support staff"]},
-            {"day": "Friday", "tasks": ["Review Friday's scheduled sessions", "Check registration numbers for upcoming sessions", "Follow up on participant feedback", "Update tracking dashboards", "Coordinate with trainers and support staff"]}
+            {"day": day, "tasks": [_DAILY_TASK_TEMPLATE[0].format(d=day), *_DAILY_TASK_TEMPLATE[1:]]}
+            for day in _DAY_NAMES
         ]
     }
     
-    # Mock gap analysis
+    # Mock gap analysis; each competency is scheduled at a fixed share of its target
+    competency_targets = aop_targets["competency_targets"]
+    competency_gaps = {}
+    for competency, ratio in _COMP_SCHED_RATIO.items():
+        target = competency_targets.get(competency, 0)
+        scheduled = target * ratio
+        gap = target - scheduled
+        competency_gaps[competency] = {
+            "scheduled": scheduled,
+            "gap": gap,
+            "gap_indicator": gap if scheduled < target else 0
+        }
+    
     gap_analysis = {
         "vilt_scheduled": aop_targets["vilt_target"] * 0.8,
         "vilt_gap": aop_targets["vilt_target"] * 0.2,
@@ -68,23 +99,7 @@ def generate_mock_results(aop_targets):
         "ilt_scheduled": aop_targets["ilt_target"] * 0.7,
         "ilt_gap": aop_targets["ilt_target"] * 0.3,
         "ilt_gap_indicator": 0 if aop_targets["ilt_target"] * 0.7 >= aop_targets["ilt_target"] else aop_targets["ilt_target"] * 0.3,
-        "competency_gaps": {
-            "technical": {
-                "scheduled": aop_targets["competency_targets"].get("technical", 0) * 0.75,
-                "gap": aop_targets["competency_targets"].get("technical", 0) * 0.25,
-                "gap_indicator": 0 if aop_targets["competency_targets"].get("technical", 0) * 0.75 >= aop_targets["competency_targets"].get("technical", 0) else aop_targets["competency_targets"].get("technical", 0) * 0.25
-            },
-            "soft_skills": {
-                "scheduled": aop_targets["competency_targets"].get("soft_skills", 0) * 0.85,
-                "gap": aop_targets["competency_targets"].get("soft_skills", 0) * 0.15,
-                "gap_indicator": 0 if aop_targets["competency_targets"].get("soft_skills", 0) * 0.85 >= aop_targets["competency_targets"].get("soft_skills", 0) else aop_targets["competency_targets"].get("soft_skills", 0) * 0.15
-            },
-            "leadership": {
-                "scheduled": aop_targets["competency_targets"].get("leadership", 0) * 0.65,
-                "gap": aop_targets["competency_targets"].get("leadership", 0) * 0.35,
-                "gap_indicator": 0 if aop_targets["competency_targets"].get("leadership", 0) * 0.65 >= aop_targets["competency_targets"].get("leadership", 0) else aop_targets["competency_targets"].get("leadership", 0) * 0.35
-            }
-        }
+        "competency_gaps": competency_gaps
     }
     
     # Mock risk assessment
@@ -139,7 +154,7 @@ def generate_mock_results(aop_targets):
     
     # Mock diagnostic report
     diagnostic_report = {
-        "report_date": datetime.now().strftime("%Y-%m-%d"),
+        "report_date": report_date,
         "strengths": [
             "Strong technical training delivery capability",
             "High participant satisfaction in cloud computing courses",
@@ -172,12 +187,181 @@ def generate_mock_results(aop_targets):
         "diagnostic_report": diagnostic_report
     }
 
+@st.cache_data(show_spinner=False)
+def _cached_run(vilt_target, ilt_target, learning_hours_target, technical, soft_skills, leadership, report_date):
+    """Memoized analysis keyed on the scalar AOP inputs and report date"""
+    aop_targets = {
+        "vilt_target": vilt_target,
+        "ilt_target": ilt_target,
+        "learning_hours_target": learning_hours_target,
+        "competency_targets": {
+            "technical": technical,
+            "soft_skills": soft_skills,
+            "leadership": leadership
+        }
+    }
+    return generate_mock_results(aop_targets, report_date)
+
 # Define a wrapper for run_aop_target_agent to avoid import issues
-def run_aop_target_agent(aop_targets, mock_mode=True):
+def run_aop_target_agent(aop_targets, mock_mode=True, report_date=None):
     """Wrapper function to run the AOP Target Agent"""
     # In a real implementation, this would call the actual agent
     # For now, we'll just use the mock results for demonstration
-    return generate_mock_results(aop_targets)
+    competency_targets = aop_targets["competency_targets"]
+    return _cached_run(
+        aop_targets["vilt_target"], aop_targets["ilt_target"], aop_targets["learning_hours_target"],
+        competency_targets["technical"], competency_targets["soft_skills"], competency_targets["leadership"],
+        report_date
+    )
+
+_RISK_LEVELS = ("High", "Medium", "Low")
+
+# Risk and opportunity cards; missing fields show as blanks
+def _risk_card(risk):
+    """HTML card for one risk"""
+    get = risk.get
+    return ('<div class="card">'
+            f'<p><strong>Area:</strong> {get("risk_area", "")}</p>'
+            f'<p><strong>Current:</strong> {get("current_value", "")}</p>'
+            f'<p><strong>Target:</strong> {get("target_value", "")}</p>'
+            f'<p><strong>Impact:</strong> {get("impact", "")}</p>'
+            f'<p><strong>Mitigation:</strong> {get("mitigation", "")}</p>'
+            '</div>')
+
+def _opportunity_card(number, opportunity):
+    """HTML card for one numbered opportunity"""
+    get = opportunity.get
+    return ('<div class="card">'
+            f'<h3>{number}. {get("opportunity", "")}</h3>'
+            f'<p><strong>Impact:</strong> {get("impact", "")}</p>'
+            f'<p><strong>Resources Needed:</strong> {get("resources_needed", "")}</p>'
+            f'<p><strong>Timeframe:</strong> {get("timeframe", "")}</p>'
+            '</div>')
+
+# Figure builders are cached on primitive tuples so reruns that leave the
+# results untouched reuse the already-built Plotly figures. Plotly is
+# imported inside them so it only loads once there is something to plot
+@st.cache_data(show_spinner=False)
+def _quarterly_fig(quarters, vilt, ilt):
+    """Grouped bar chart of the quarterly session targets"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[
+        go.Bar(name="VILT Target", x=quarters, y=vilt, marker_color="#1E88E5"),
+        go.Bar(name="ILT Target", x=quarters, y=ilt, marker_color="#FFC107")
+    ])
+    
+    fig.update_layout(
+        title="Quarterly Training Targets",
+        barmode="group",
+        xaxis_title="Quarter",
+        yaxis_title="Number of Sessions",
+        legend_title="Target Type",
+        height=400
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _monthly_fig(months, vilt, ilt):
+    """Line chart of the monthly session targets"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[
+        go.Scatter(name="VILT Target", x=months, y=vilt, mode="lines+markers", line_color="#1E88E5"),
+        go.Scatter(name="ILT Target", x=months, y=ilt, mode="lines+markers", line_color="#FFC107")
+    ])
+    
+    fig.update_layout(
+        title="Monthly Training Targets",
+        xaxis_title="Month",
+        yaxis_title="Number of Sessions",
+        legend_title="Target Type",
+        height=400
+    )
+    return fig
+
+@functools.lru_cache(maxsize=128)
+def _pct(scheduled, target):
+    """Scheduled share of a target as a whole percentage capped at 100"""
+    if target <= 0:
+        return 0
+    return min(100, int((scheduled / target) * 100))
+
+# Gauge parts shared by every progress gauge; only the bar colour differs
+_GAUGE_AXIS = {"range": [0, 100], "tickwidth": 1}
+_GAUGE_STEPS = (
+    {"range": [0, 50], "color": "#FFCDD2"},
+    {"range": [50, 80], "color": "#FFECB3"},
+    {"range": [80, 100], "color": "#C8E6C9"}
+)
+_GAUGE_THRESHOLD = {"line": {"color": "red", "width": 4}, "thickness": 0.75, "value": 100}
+
+@st.cache_data(show_spinner=False)
+def _gauge_fig(value, title, color):
+    """Progress gauge from 0 to 100 percent"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={"text": title},
+        gauge={"axis": _GAUGE_AXIS, "bar": {"color": color}, "steps": _GAUGE_STEPS, "threshold": _GAUGE_THRESHOLD}
+    ))
+    
+    fig.update_layout(height=250)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _competency_fig(competencies, targets, scheduled):
+    """Grouped bar chart of competency targets against scheduled hours"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[
+        go.Bar(name="Target", x=competencies, y=targets, marker_color="#1E88E5"),
+        go.Bar(name="Scheduled", x=competencies, y=scheduled, marker_color="#4CAF50")
+    ])
+    
+    fig.update_layout(
+        title="Competency Targets vs. Scheduled",
+        barmode="group",
+        xaxis_title="Competency",
+        yaxis_title="Hours",
+        legend_title="Type",
+        height=400
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _risk_pie_fig(risk_counts):
+    """Pie chart of risks by level"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Pie(
+        labels=_RISK_LEVELS,
+        values=risk_counts,
+        marker_colors=["#D32F2F", "#F57C00", "#388E3C"]
+    ))
+    
+    fig.update_layout(title="Risk Distribution", height=350)
+    return fig
+
+# Export payloads are cached on a key identifying the run; the underscore
+# arguments are not hashed by Streamlit
+@st.cache_data(show_spinner=False)
+def _export_json(export_key, _results):
+    """Serialize the full results as indented JSON bytes"""
+    return orjson.dumps(_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str)
+
+@st.cache_data(show_spinner=False)
+def _export_csv(export_key, _diagnostic_report):
+    """Flatten the diagnostic report into Category,Item CSV rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["Category", "Item"])
+    for category, key in (("Strength", "strengths"), ("Weakness", "weaknesses"),
+                          ("Future Risk", "future_risks"), ("Recommendation", "recommendations")):
+        writer.writerows((category, item) for item in _diagnostic_report.get(key, []))
+    return buffer.getvalue()
 
 # Set page configuration
 st.set_page_config(
@@ -188,7 +372,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -205,6 +389,13 @@ st.markdown("""
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         margin-bottom: 20px;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-row .metric-card {
+        flex: 1;
+    }
     .metric-card {
         text-align: center;
         padding: 15px;
@@ -234,11 +425,287 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    """Emit the custom CSS; cached so reruns replay it instead of rebuilding it"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+# Each results tab renders as its own fragment
+@st.fragment
+def _render_breakdown():
+    """Render the Target Breakdown tab"""
+    # Deferred so the first paint does not wait on pandas
+    import pandas as pd
+    
+    results = st.session_state.aop_results
+    
+    # Header and summary metrics go out as one HTML block
+    annual = results["target_breakdown"]["annual"]
+    metric_cards = "".join(
+        '<div class="metric-card">'
+        f'<div class="metric-value">{annual[key]}</div>'
+        f'<div class="metric-label">{label}</div>'
+        '</div>'
+        for key, label in (("vilt_target", "Annual VILT Target"),
+                           ("ilt_target", "Annual ILT Target"),
+                           ("learning_hours_target", "Learning Hours Target"))
+    )
+    st.markdown('<h2 class="sub-header">Target Breakdown</h2>'
+                f'<div class="metric-row">{metric_cards}</div>', unsafe_allow_html=True)
+    
+    # Quarterly breakdown
+    st.markdown("### Quarterly Breakdown")
+    
+    # Build the quarterly DataFrame column by column with explicit
+    # dtypes so the Arrow conversion behind st.dataframe skips inference
+    quarters = [q for q in results["target_breakdown"]["quarterly"]
+                if isinstance(q, dict) and ("quarter" in q or "timeframe_name" in q)]
+    
+    if quarters:
+        df_quarterly = pd.DataFrame({
+            "Quarter": pd.array([q.get("quarter") or q.get("timeframe_name") for q in quarters], dtype="string"),
+            "VILT Target": np.array([int(q["vilt_target"]) for q in quarters], dtype=np.int64),
+            "ILT Target": np.array([int(q["ilt_target"]) for q in quarters], dtype=np.int64)
+        })
+        
+        # Create a bar chart for quarterly breakdown
+        fig = _quarterly_fig(
+            tuple(df_quarterly["Quarter"]),
+            tuple(df_quarterly["VILT Target"]),
+            tuple(df_quarterly["ILT Target"])
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Display quarterly data as a table
+        st.dataframe(df_quarterly, use_container_width=True)
+    
+    # Monthly breakdown
+    st.markdown("### Monthly Breakdown")
+    
+    # Build the monthly DataFrame column by column
+    months = [m for m in results["target_breakdown"]["monthly"]
+              if isinstance(m, dict) and ("month" in m or "timeframe_name" in m)]
+    
+    if months:
+        df_monthly = pd.DataFrame({
+            "Month": pd.array([m.get("month") or m.get("timeframe_name") for m in months], dtype="string"),
+            "VILT Target": np.array([int(m["vilt_target"]) for m in months], dtype=np.int64),
+            "ILT Target": np.array([int(m["ilt_target"]) for m in months], dtype=np.int64)
+        })
+        
+        # Create a line chart for monthly breakdown
+        fig = _monthly_fig(
+            tuple(df_monthly["Month"]),
+            tuple(df_monthly["VILT Target"]),
+            tuple(df_monthly["ILT Target"])
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Weekly and daily tasks
+    col1, col2 = st.columns(2)
+    
+    # Each column is sent as a single markdown block
+    with col1:
+        st.markdown("### Weekly Tasks")
+        st.markdown("\n\n".join(
+            f"**{week.get('timeframe_name', week.get('week', 'Week'))}**\n" + "\n".join(f"- {task}" for task in week["tasks"])
+            for week in results["target_breakdown"]["weekly"] if "tasks" in week
+        ))
+    
+    with col2:
+        st.markdown("### Daily Tasks")
+        st.markdown("\n\n".join(
+            f"**{day.get('day', 'Day')}**\n" + "\n".join(f"- {task}" for task in day["tasks"])
+            for day in results["target_breakdown"]["daily"] if "tasks" in day
+        ))
+
+@st.fragment
+def _render_gap_analysis():
+    """Render the Gap Analysis tab"""
+    # Deferred so the first paint does not wait on pandas
+    import pandas as pd
+    
+    results = st.session_state.aop_results
+    
+    st.markdown('<h2 class="sub-header">Gap Analysis</h2>', unsafe_allow_html=True)
+    
+    gap_analysis = results["gap_analysis"]
+    
+    # Create metrics for gap analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # VILT Gap
+        vilt_scheduled = gap_analysis.get("vilt_scheduled", 0)
+        vilt_target = results["target_breakdown"]["annual"]["vilt_target"]
+        vilt_gap = gap_analysis.get("vilt_gap", 0)
+        vilt_gap_indicator = gap_analysis.get("vilt_gap_indicator", 0)
+        
+        # Create a gauge chart for VILT progress
+        vilt_percent = _pct(vilt_scheduled, vilt_target)
+        
+        fig = _gauge_fig(vilt_percent, "VILT Progress", "#1E88E5")
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown('<div class="card">'
+                    f'<p><strong>VILT Target:</strong> {vilt_target}</p>'
+                    f'<p><strong>Scheduled:</strong> {vilt_scheduled}</p>'
+                    f'<p><strong>Gap:</strong> {vilt_gap}</p>'
+                    f'<p><strong>Gap Indicator:</strong> {vilt_gap_indicator} (0 = No Gap)</p>'
+                    '</div>', unsafe_allow_html=True)
+    
+    with col2:
+        # ILT Gap
+        ilt_scheduled = gap_analysis.get("ilt_scheduled", 0)
+        ilt_target = results["target_breakdown"]["annual"]["ilt_target"]
+        ilt_gap = gap_analysis.get("ilt_gap", 0)
+        ilt_gap_indicator = gap_analysis.get("ilt_gap_indicator", 0)
+        
+        # Create a gauge chart for ILT progress
+        ilt_percent = _pct(ilt_scheduled, ilt_target)
+        
+        fig = _gauge_fig(ilt_percent, "ILT Progress", "#FFC107")
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown('<div class="card">'
+                    f'<p><strong>ILT Target:</strong> {ilt_target}</p>'
+                    f'<p><strong>Scheduled:</strong> {ilt_scheduled}</p>'
+                    f'<p><strong>Gap:</strong> {ilt_gap}</p>'
+                    f'<p><strong>Gap Indicator:</strong> {ilt_gap_indicator} (0 = No Gap)</p>'
+                    '</div>', unsafe_allow_html=True)
+    
+    # Competency gaps
+    st.markdown("### Competency Gaps")
+    
+    competency_gaps = gap_analysis.get("competency_gaps", {})
+    if competency_gaps:
+        # Build the competency DataFrame column by column
+        competency_targets = results["target_breakdown"]["annual"]["competency_targets"]
+        gaps = competency_gaps.values()
+        df_competency = pd.DataFrame({
+            "Competency": pd.array([competency.capitalize() for competency in competency_gaps], dtype="string"),
+            "Target": np.array([competency_targets.get(competency, 0) for competency in competency_gaps], dtype=np.int64),
+            "Scheduled": np.array([gap_data.get("scheduled", 0) for gap_data in gaps], dtype=np.float64),
+            "Gap": np.array([gap_data.get("gap", 0) for gap_data in gaps], dtype=np.float64),
+            "Gap Indicator": np.array([gap_data.get("gap_indicator", 0) for gap_data in gaps], dtype=np.float64)
+        })
+        
+        # Create a bar chart for competency gaps
+        fig = _competency_fig(
+            tuple(df_competency["Competency"]),
+            tuple(df_competency["Target"]),
+            tuple(df_competency["Scheduled"])
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Display competency data as a table
+        st.dataframe(df_competency, use_container_width=True)
+
+@st.fragment
+def _render_risks():
+    """Render the Risk Assessment tab"""
+    results = st.session_state.aop_results
+    
+    st.markdown('<h2 class="sub-header">Risk Assessment</h2>', unsafe_allow_html=True)
+    
+    risk_assessment = results["risk_assessment"]
+    
+    # Group risks by level in a single pass
+    risk_buckets = {level: [] for level in _RISK_LEVELS}
+    for risk in risk_assessment:
+        risk_buckets.setdefault(risk.get("risk_level"), []).append(risk)
+    
+    # Create a pie chart for risk distribution; counts come straight from the buckets
+    risk_counts = tuple(len(risk_buckets[level]) for level in _RISK_LEVELS)
+    fig = _risk_pie_fig(risk_counts)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Display risks by level, one markdown block per column
+    columns = st.columns(3)
+    for column, level in zip(columns, _RISK_LEVELS):
+        bucket = risk_buckets[level]
+        with column:
+            heading = f'<h3 class="risk-{level.lower()}">{level} Risks</h3>'
+            if bucket:
+                st.markdown(heading + "".join(map(_risk_card, bucket)),
+                            unsafe_allow_html=True)
+            else:
+                st.markdown(heading, unsafe_allow_html=True)
+                st.info(f"No {level.lower()} risks identified")
+
+@st.fragment
+def _render_opportunities():
+    """Render the Opportunities tab"""
+    results = st.session_state.aop_results
+    
+    st.markdown('<h2 class="sub-header">Opportunities</h2>', unsafe_allow_html=True)
+    
+    opportunities = results["opportunities"]
+    
+    if opportunities:
+        st.markdown("".join(_opportunity_card(i + 1, opportunity) for i, opportunity in enumerate(opportunities)),
+                    unsafe_allow_html=True)
+    else:
+        st.info("No opportunities identified")
+
+@st.fragment
+def _render_diagnostic():
+    """Render the Diagnostic Report tab with its export controls"""
+    results = st.session_state.aop_results
+    report_date = st.session_state.report_date
+    
+    st.markdown('<h2 class="sub-header">Diagnostic Report</h2>', unsafe_allow_html=True)
+    
+    diagnostic_report = results["diagnostic_report"]
+    
+    # Summary
+    if "summary" in diagnostic_report:
+        st.markdown(f"### Summary\n{diagnostic_report['summary']}")
+    
+    # Strengths, weaknesses, future risks and recommendations in a
+    # two-by-two grid, one markdown block per section
+    sections = (("Strengths", "strengths"), ("Weaknesses", "weaknesses"),
+                ("Future Risks", "future_risks"), ("Recommendations", "recommendations"))
+    for row in (sections[:2], sections[2:]):
+        for column, (title, key) in zip(st.columns(2), row):
+            with column:
+                st.markdown(f"### {title}\n" + "\n".join(f"- {item}" for item in diagnostic_report.get(key, [])))
+    
+    # Export options
+    st.markdown("### Export Report")
+    
+    export_format = st.selectbox("Select export format", ["JSON", "CSV"])
+    
+    # The run inputs and report date identify the results, so the
+    # export payloads are cached on them instead of hashing the results
+    export_key = (st.session_state.aop_key, report_date)
+    
+    if st.button("Export Report"):
+        today_stamp = datetime.now().strftime("%Y%m%d")
+        if export_format == "JSON":
+            # Convert to JSON
+            st.download_button(
+                label="Download JSON",
+                data=_export_json(export_key, results),
+                file_name=f"aop_target_report_{today_stamp}.json",
+                mime="application/json"
+            )
+        else:
+            # Create a simple CSV for diagnostic report
+            st.download_button(
+                label="Download CSV",
+                data=_export_csv(export_key, diagnostic_report),
+                file_name=f"aop_target_report_{today_stamp}.csv",
+                mime="text/csv"
+            )
 
 def main():
     """Main function to run the Streamlit app"""
     
+    _inject_css()
+    
     # Sidebar
     with st.sidebar:
         st.image("https://img.icons8.com/color/96/000000/business-report.png", width=100)
@@ -264,15 +731,27 @@ def main():
         run_button = st.button("Run Analysis")
     
     # Main content
-    st.markdown('<h1 class="main-header">AOP Target Breakdown Agent</h1>', unsafe_allow_html=True)
-    st.markdown('<p>Breaking down Annual Operating Plan targets into actionable timeframes for Global Learning Delivery</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">AOP Target Breakdown Agent</h1>'
+                '<p>Breaking down Annual Operating Plan targets into actionable timeframes for Global Learning Delivery</p>',
+                unsafe_allow_html=True)
     
-    # Initialize session state
-    if 'results' not in st.session_state:
-        st.session_state.results = None
+    # Initialize session state; results persist across reruns and are only
+    # recomputed when Run is clicked with inputs that differ from aop_key
+    st.session_state.setdefault("aop_results", None)
+    st.session_state.setdefault("aop_key", None)
+    
+    # Pin the report date for the session so cached results keep a stable key
+    report_date = st.session_state.setdefault("report_date", datetime.now().strftime("%Y-%m-%d"))
+    
+    # Inputs of the current run; clicking Run again with the same inputs
+    # keeps the results already in the session
+    run_key = (vilt_target, ilt_target, learning_hours_target,
+               technical_target, soft_skills_target, leadership_target, mock_mode)
     
     # Process when Run button is clicked
-    if run_button:
+    if run_button and st.session_state.aop_key == run_key and st.session_state.aop_results:
+        st.success("Mock analysis completed!" if mock_mode else "Analysis completed successfully!")
+    elif run_button:
         with st.spinner("Running AOP Target Analysis..."):
             # Prepare AOP targets
             aop_targets = {
@@ -286,429 +765,35 @@ def main():
                 }
             }
             
-            # Run the agent or generate mock results
-            if mock_mode:
-                results = generate_mock_results(aop_targets)
-                st.success("Mock analysis completed!")
-            else:
-                try:
-                    results = run_aop_target_agent(aop_targets, mock_mode=True)
-                    st.success("Analysis completed successfully!")
-                except Exception as e:
-                    st.error(f"Error during analysis: {str(e)}")
-                    results = None
+            # Run the agent; the wrapper decides between mock and real results
+            try:
+                results = run_aop_target_agent(aop_targets, mock_mode=mock_mode, report_date=report_date)
+                st.success("Mock analysis completed!" if mock_mode else "Analysis completed successfully!")
+            except Exception as e:
+                st.error(f"Error during analysis: {str(e)}")
+                results = None
             
             # Store results in session state
-            st.session_state.results = results
+            st.session_state.aop_results = results
+            st.session_state.aop_key = run_key if results else None
     
     # Display results if available
-    if st.session_state.results:
-        results = st.session_state.results
-        
-        # Create tabs for different sections
+    if st.session_state.aop_results:
+        # Create tabs for different sections; each tab is a fragment that
+        # reads the results from session state, so widget interactions only
+        # rerun the tab they belong to
         tabs = st.tabs(["Target Breakdown", "Gap Analysis", "Risk Assessment", "Opportunities", "Diagnostic Report"])
         
-        # Tab 1: Target Breakdown
         with tabs[0]:
-            st.markdown('<h2 class="sub-header">Target Breakdown</h2>', unsafe_allow_html=True)
-            
-            # Summary metrics
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.markdown('<div class="metric-card">'
-                            f'<div class="metric-value">{results["target_breakdown"]["annual"]["vilt_target"]}</div>'
-                            '<div class="metric-label">Annual VILT Target</div>'
-                            '</div>', unsafe_allow_html=True)
-            with col2:
-                st.markdown('<div class="metric-card">'
-                            f'<div class="metric-value">{results["target_breakdown"]["annual"]["ilt_target"]}</div>'
-                            '<div class="metric-label">Annual ILT Target</div>'
-                            '</div>', unsafe_allow_html=True)
-            with col3:
-                st.markdown('<div class="metric-card">'
-                            f'<div class="metric-value">{results["target_breakdown"]["annual"]["learning_hours_target"]}</div>'
-                            '<div class="metric-label">Learning Hours Target</div>'
-                            '</div>', unsafe_allow_html=True)
-            
-            # Quarterly breakdown
-            st.markdown("### Quarterly Breakdown")
-            
-            # Convert quarterly data to DataFrame
-            quarterly_data = []
-            for q in results["target_breakdown"]["quarterly"]:
-                if isinstance(q, dict) and "quarter" in q:
-                    quarterly_data.append({
-                        "Quarter": q["quarter"],
-                        "VILT Target": int(q["vilt_target"]),
-                        "ILT Target": int(q["ilt_target"])
-                    })
-                elif isinstance(q, dict) and "timeframe_name" in q:
-                    quarterly_data.append({
-                        "Quarter": q["timeframe_name"],
-                        "VILT Target": int(q["vilt_target"]),
-                        "ILT Target": int(q["ilt_target"])
-                    })
-            
-            if quarterly_data:
-                df_quarterly = pd.DataFrame(quarterly_data)
-                
-                # Create a bar chart for quarterly breakdown
-                fig = px.bar(df_quarterly, x="Quarter", y=["VILT Target", "ILT Target"], 
-                            barmode="group", title="Quarterly Training Targets",
-                            color_discrete_sequence=["#1E88E5", "#FFC107"])
-                
-                fig.update_layout(
-                    xaxis_title="Quarter",
-                    yaxis_title="Number of Sessions",
-                    legend_title="Target Type",
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Display quarterly data as a table
-                st.dataframe(df_quarterly, use_container_width=True)
-            
-            # Monthly breakdown
-            st.markdown("### Monthly Breakdown")
-            
-            # Convert monthly data to DataFrame
-            monthly_data = []
-            for m in results["target_breakdown"]["monthly"]:
-                if isinstance(m, dict) and "month" in m:
-                    monthly_data.append({
-                        "Month": m["month"],
-                        "VILT Target": int(m["vilt_target"]),
-                        "ILT Target": int(m["ilt_target"])
-                    })
-                elif isinstance(m, dict) and "timeframe_name" in m:
-                    monthly_data.append({
-                        "Month": m["timeframe_name"],
-                        "VILT Target": int(m["vilt_target"]),
-                        "ILT Target": int(m["ilt_target"])
-                    })
-            
-            if monthly_data:
-                df_monthly = pd.DataFrame(monthly_data)
-                
-                # Create a line chart for monthly breakdown
-                fig = px.line(df_monthly, x="Month", y=["VILT Target", "ILT Target"], 
-                            title="Monthly Training Targets",
-                            markers=True, color_discrete_sequence=["#1E88E5", "#FFC107"])
-                
-                fig.update_layout(
-                    xaxis_title="Month",
-                    yaxis_title="Number of Sessions",
-                    legend_title="Target Type",
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Weekly and daily tasks
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("### Weekly Tasks")
-                for week in results["target_breakdown"]["weekly"]:
-                    if "tasks" in week:
-                        st.markdown(f"**{week.get('timeframe_name', week.get('week', 'Week'))}**")
-                        for task in week["tasks"]:
-                            st.markdown(f"- {task}")
-            
-            with col2:
-                st.markdown("### Daily Tasks")
-                for day in results["target_breakdown"]["daily"]:
-                    if "tasks" in day:
-                        st.markdown(f"**{day.get('day', 'Day')}**")
-                        for task in day["tasks"]:
-                            st.markdown(f"- {task}")
-        
-        # Tab 2: Gap Analysis
+            _render_breakdown()
         with tabs[1]:
-            st.markdown('<h2 class="sub-header">Gap Analysis</h2>', unsafe_allow_html=True)
-            
-            gap_analysis = results["gap_analysis"]
-            
-            # Create metrics for gap analysis
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # VILT Gap
-                vilt_scheduled = gap_analysis.get("vilt_scheduled", 0)
-                vilt_target = results["target_breakdown"]["annual"]["vilt_target"]
-                vilt_gap = gap_analysis.get("vilt_gap", 0)
-                vilt_gap_indicator = gap_analysis.get("vilt_gap_indicator", 0)
-                
-                # Create a gauge chart for VILT progress
-                vilt_percent = min(100, int((vilt_scheduled / vilt_target) * 100)) if vilt_target > 0 else 0
-                
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=vilt_percent,
-                    title={"text": "VILT Progress"},
-                    gauge={
-                        "axis": {"range": [0, 100], "tickwidth": 1},
-                        "bar": {"color": "#1E88E5"},
-                        "steps": [
-                            {"range": [0, 50], "color": "#FFCDD2"},
-                            {"range": [50, 80], "color": "#FFECB3"},
-                            {"range": [80, 100], "color": "#C8E6C9"}
-                        ],
-                        "threshold": {
-                            "line": {"color": "red", "width": 4},
-                            "thickness": 0.75,
-                            "value": 100
-                        }
-                    }
-                ))
-                
-                fig.update_layout(height=250)
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.markdown('<div class="card">'
-                            f'<p><strong>VILT Target:</strong> {vilt_target}</p>'
-                            f'<p><strong>Scheduled:</strong> {vilt_scheduled}</p>'
-                            f'<p><strong>Gap:</strong> {vilt_gap}</p>'
-                            f'<p><strong>Gap Indicator:</strong> {vilt_gap_indicator} (0 = No Gap)</p>'
-                            '</div>', unsafe_allow_html=True)
-            
-            with col2:
-                # ILT Gap
-                ilt_scheduled = gap_analysis.get("ilt_scheduled", 0)
-                ilt_target = results["target_breakdown"]["annual"]["ilt_target"]
-                ilt_gap = gap_analysis.get("ilt_gap", 0)
-                ilt_gap_indicator = gap_analysis.get("ilt_gap_indicator", 0)
-                
-                # Create a gauge chart for ILT progress
-                ilt_percent = min(100, int((ilt_scheduled / ilt_target) * 100)) if ilt_target > 0 else 0
-                
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=ilt_percent,
-                    title={"text": "ILT Progress"},
-                    gauge={
-                        "axis": {"range": [0, 100], "tickwidth": 1},
-                        "bar": {"color": "#FFC107"},
-                        "steps": [
-                            {"range": [0, 50], "color": "#FFCDD2"},
-                            {"range": [50, 80], "color": "#FFECB3"},
-                            {"range": [80, 100], "color": "#C8E6C9"}
-                        ],
-                        "threshold": {
-                            "line": {"color": "red", "width": 4},
-                            "thickness": 0.75,
-                            "value": 100
-                        }
-                    }
-                ))
-                
-                fig.update_layout(height=250)
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.markdown('<div class="card">'
-                            f'<p><strong>ILT Target:</strong> {ilt_target}</p>'
-                            f'<p><strong>Scheduled:</strong> {ilt_scheduled}</p>'
-                            f'<p><strong>Gap:</strong> {ilt_gap}</p>'
-                            f'<p><strong>Gap Indicator:</strong> {ilt_gap_indicator} (0 = No Gap)</p>'
-                            '</div>', unsafe_allow_html=True)
-            
-            # Competency gaps
-            st.markdown("### Competency Gaps")
-            
-            competency_gaps = gap_analysis.get("competency_gaps", {})
-            if competency_gaps:
-                # Create a DataFrame for competency gaps
-                competency_data = []
-                for competency, gap_data in competency_gaps.items():
-                    competency_data.append({
-                        "Competency": competency.capitalize(),
-                        "Target": results["target_breakdown"]["annual"]["competency_targets"].get(competency, 0),
-                        "Scheduled": gap_data.get("scheduled", 0),
-                        "Gap": gap_data.get("gap", 0),
-                        "Gap Indicator": gap_data.get("gap_indicator", 0)
-                    })
-                
-                df_competency = pd.DataFrame(competency_data)
-                
-                # Create a bar chart for competency gaps
-                fig = px.bar(df_competency, x="Competency", y=["Target", "Scheduled"], 
-                            barmode="group", title="Competency Targets vs. Scheduled",
-                            color_discrete_sequence=["#1E88E5", "#4CAF50"])
-                
-                fig.update_layout(
-                    xaxis_title="Competency",
-                    yaxis_title="Hours",
-                    legend_title="Type",
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Display competency data as a table
-                st.dataframe(df_competency, use_container_width=True)
-        
-        # Tab 3: Risk Assessment
+            _render_gap_analysis()
         with tabs[2]:
-            st.markdown('<h2 class="sub-header">Risk Assessment</h2>', unsafe_allow_html=True)
-            
-            risk_assessment = results["risk_assessment"]
-            
-            # Group risks by level
-            high_risks = [risk for risk in risk_assessment if risk.get("risk_level") == "High"]
-            medium_risks = [risk for risk in risk_assessment if risk.get("risk_level") == "Medium"]
-            low_risks = [risk for risk in risk_assessment if risk.get("risk_level") == "Low"]
-            
-            # Create a pie chart for risk distribution
-            risk_counts = [len(high_risks), len(medium_risks), len(low_risks)]
-            risk_labels = ["High", "Medium", "Low"]
-            
-            fig = px.pie(
-                values=risk_counts,
-                names=risk_labels,
-                title="Risk Distribution",
-                color_discrete_sequence=["#D32F2F", "#F57C00", "#388E3C"]
-            )
-            
-            fig.update_layout(height=350)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display risks by level
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown('<h3 class="risk-high">High Risks</h3>', unsafe_allow_html=True)
-                if high_risks:
-                    for risk in high_risks:
-                        st.markdown('<div class="card">'
-                                    f'<p><strong>Area:</strong> {risk.get("risk_area", "")}</p>'
-                                    f'<p><strong>Current:</strong> {risk.get("current_value", "")}</p>'
-                                    f'<p><strong>Target:</strong> {risk.get("target_value", "")}</p>'
-                                    f'<p><strong>Impact:</strong> {risk.get("impact", "")}</p>'
-                                    f'<p><strong>Mitigation:</strong> {risk.get("mitigation", "")}</p>'
-                                    '</div>', unsafe_allow_html=True)
-                else:
-                    st.info("No high risks identified")
-            
-            with col2:
-                st.markdown('<h3 class="risk-medium">Medium Risks</h3>', unsafe_allow_html=True)
-                if medium_risks:
-                    for risk in medium_risks:
-                        st.markdown('<div class="card">'
-                                    f'<p><strong>Area:</strong> {risk.get("risk_area", "")}</p>'
-                                    f'<p><strong>Current:</strong> {risk.get("current_value", "")}</p>'
-                                    f'<p><strong>Target:</strong> {risk.get("target_value", "")}</p>'
-                                    f'<p><strong>Impact:</strong> {risk.get("impact", "")}</p>'
-                                    f'<p><strong>Mitigation:</strong> {risk.get("mitigation", "")}</p>'
-                                    '</div>', unsafe_allow_html=True)
-                else:
-                    st.info("No medium risks identified")
-            
-            with col3:
-                st.markdown('<h3 class="risk-low">Low Risks</h3>', unsafe_allow_html=True)
-                if low_risks:
-                    for risk in low_risks:
-                        st.markdown('<div class="card">'
-                                    f'<p><strong>Area:</strong> {risk.get("risk_area", "")}</p>'
-                                    f'<p><strong>Current:</strong> {risk.get("current_value", "")}</p>'
-                                    f'<p><strong>Target:</strong> {risk.get("target_value", "")}</p>'
-                                    f'<p><strong>Impact:</strong> {risk.get("impact", "")}</p>'
-                                    f'<p><strong>Mitigation:</strong> {risk.get("mitigation", "")}</p>'
-                                    '</div>', unsafe_allow_html=True)
-                else:
-                    st.info("No low risks identified")
-        
-        # Tab 4: Opportunities
+            _render_risks()
         with tabs[3]:
-            st.markdown('<h2 class="sub-header">Opportunities</h2>', unsafe_allow_html=True)
-            
-            opportunities = results["opportunities"]
-            
-            if opportunities:
-                for i, opportunity in enumerate(opportunities):
-                    st.markdown('<div class="card">'
-                                f'<h3>{i+1}. {opportunity.get("opportunity", "")}</h3>'
-                                f'<p><strong>Impact:</strong> {opportunity.get("impact", "")}</p>'
-                                f'<p><strong>Resources Needed:</strong> {opportunity.get("resources_needed", "")}</p>'
-                                f'<p><strong>Timeframe:</strong> {opportunity.get("timeframe", "")}</p>'
-                                '</div>', unsafe_allow_html=True)
-            else:
-                st.info("No opportunities identified")
-        
-        # Tab 5: Diagnostic Report
+            _render_opportunities()
         with tabs[4]:
-            st.markdown('<h2 class="sub-header">Diagnostic Report</h2>', unsafe_allow_html=True)
-            
-            diagnostic_report = results["diagnostic_report"]
-            
-            # Summary
-            if "summary" in diagnostic_report:
-                st.markdown(f"### Summary")
-                st.markdown(f"{diagnostic_report['summary']}")
-            
-            # Create columns for strengths and weaknesses
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("### Strengths")
-                for strength in diagnostic_report.get("strengths", []):
-                    st.markdown(f"- {strength}")
-            
-            with col2:
-                st.markdown("### Weaknesses")
-                for weakness in diagnostic_report.get("weaknesses", []):
-                    st.markdown(f"- {weakness}")
-            
-            # Future risks and recommendations
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("### Future Risks")
-                for risk in diagnostic_report.get("future_risks", []):
-                    st.markdown(f"- {risk}")
-            
-            with col2:
-                st.markdown("### Recommendations")
-                for recommendation in diagnostic_report.get("recommendations", []):
-                    st.markdown(f"- {recommendation}")
-            
-            # Export options
-            st.markdown("### Export Report")
-            
-            export_format = st.selectbox("Select export format", ["JSON", "CSV"])
-            
-            if st.button("Export Report"):
-                if export_format == "JSON":
-                    # Convert to JSON
-                    json_data = json.dumps(results, indent=2)
-                    st.download_button(
-                        label="Download JSON",
-                        data=json_data,
-                        file_name=f"aop_target_report_{datetime.now().strftime('%Y%m%d')}.json",
-                        mime="application/json"
-                    )
-                else:
-                    # Create a simple CSV for diagnostic report
-                    csv_data = "Category,Item\n"
-                    
-                    for strength in diagnostic_report.get("strengths", []):
-                        csv_data += f"Strength,\"{strength}\"\n"
-                    
-                    for weakness in diagnostic_report.get("weaknesses", []):
-                        csv_data += f"Weakness,\"{weakness}\"\n"
-                    
-                    for risk in diagnostic_report.get("future_risks", []):
-                        csv_data += f"Future Risk,\"{risk}\"\n"
-                    
-                    for recommendation in diagnostic_report.get("recommendations", []):
-                        csv_data += f"Recommendation,\"{recommendation}\"\n"
-                    
-                    st.download_button(
-                        label="Download CSV",
-                        data=csv_data,
-                        file_name=f"aop_target_report_{datetime.now().strftime('%Y%m%d')}.csv",
-                        mime="text/csv"
-                    )
+            _render_diagnostic()
     else:
         # Display instructions if no results yet
         st.info("Enter your AOP targets in the sidebar and click 'Run Analysis' to get started.")
@@ -7,72 +7,119 @@ These functions simulate retrieving data from various systems like iEvolve, iGla
 In a real implementation, these would connect to actual data sources.
 """
 
+import time
 import random
+import functools
+import threading
+import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+# Mock data is generated for the year the process started in
+_CURRENT_YEAR = datetime.now().year
+
+# Shared catalogues used by the mock generators
+ACTIVITY_TYPES = ("VILT", "ILT")
+COMPETENCY_AREAS = ("Technical", "Soft Skills", "Leadership", "Domain Knowledge", "Process")
+COURSE_CATALOG = (
+    "Python Programming Fundamentals", "Advanced Java Development", 
+    "Cloud Architecture Principles", "DevOps Essentials",
+    "Effective Communication", "Leadership Skills", 
+    "Project Management", "Agile Methodologies",
+    "Data Science Basics", "Machine Learning Fundamentals",
+    "Cybersecurity Essentials", "Blockchain Technology"
+)
+
+def ttl_cache(ttl=300):
+    """Memoize a data source for ``ttl`` seconds, keyed on its arguments.
+
+    Cached results are shared between callers and must be treated as
+    read-only. The wrapped function gains a ``cache_clear()`` method.
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+            result = func(*args, **kwargs)
+            with lock:
+                cache[key] = (now, result)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
 
 # Generate random dates within the current year
-def random_date(start_date=None, end_date=None):
-    if not start_date:
-        start_date = datetime(datetime.now().year, 1, 1)
-    if not end_date:
-        end_date = datetime(datetime.now().year, 12, 31)
-    
-    delta = end_date - start_date
-    random_days = random.randrange(delta.days)
-    return start_date + timedelta(days=random_days)
+@functools.lru_cache(maxsize=1)
+def _year_span():
+    """First day of the current year and the number of days random dates span"""
+    start_date = datetime(_CURRENT_YEAR, 1, 1)
+    return start_date, (datetime(start_date.year, 12, 31) - start_date).days
+
+def random_dates(n, rng):
+    """Draw ``n`` dates within the current year as ISO strings in one batch"""
+    start_date, days = _year_span()
+    offsets = rng.integers(0, days, n).astype("timedelta64[D]")
+    return np.datetime_as_string(np.datetime64(start_date.date()) + offsets, unit="D").tolist()
 
 # Mock learning activity data
-def generate_learning_activities(count=50):
-    """Generate mock learning activities"""
-    activity_types = ["VILT", "ILT"]
-    competency_areas = ["Technical", "Soft Skills", "Leadership", "Domain Knowledge", "Process"]
-    course_titles = [
-        "Python Programming Fundamentals", "Advanced Java Development", 
-        "Cloud Architecture Principles", "DevOps Essentials",
-        "Effective Communication", "Leadership Skills", 
-        "Project Management", "Agile Methodologies",
-        "Data Science Basics", "Machine Learning Fundamentals",
-        "Cybersecurity Essentials", "Blockchain Technology"
-    ]
+def generate_learning_activities(count=50, rng=None):
+    """Generate mock learning activities, drawing every field in bulk from the NumPy generator ``rng``"""
+    if rng is None:
+        rng = np.random.default_rng()
+    types = rng.choice(ACTIVITY_TYPES, count)
+    competencies = rng.choice(COMPETENCY_AREAS, count)
+    titles = rng.choice(COURSE_CATALOG, count)
     
-    activities = []
-    for i in range(count):
-        activity_type = random.choice(activity_types)
-        competency = random.choice(competency_areas)
-        title = random.choice(course_titles)
-        
-        # Generate more realistic data based on activity type
-        if activity_type == "VILT":
-            duration = random.uniform(1.0, 4.0)  # 1-4 hours
-            capacity = random.randint(15, 50)
-        else:  # ILT
-            duration = random.uniform(4.0, 16.0)  # 4-16 hours (1-2 days)
-            capacity = random.randint(10, 30)
-        
-        # Generate realistic registration and completion numbers
-        registrations = random.randint(int(capacity * 0.5), capacity)
-        completion_rate = random.uniform(0.7, 0.95)
-        completions = int(registrations * completion_rate)
-        
-        activity = {
+    # Generate more realistic data based on activity type: VILT runs 1-4
+    # hours for 15-50 people, ILT 4-16 hours (1-2 days) for 10-30 people
+    is_vilt = types == "VILT"
+    durations = np.where(is_vilt, rng.uniform(1.0, 4.0, count), rng.uniform(4.0, 16.0, count)).round(1)
+    capacities = np.where(is_vilt, rng.integers(15, 51, count), rng.integers(10, 31, count))
+    
+    # Generate realistic registration and completion numbers
+    registrations = rng.integers((capacities * 0.5).astype(int), capacities + 1)
+    completions = (registrations * rng.uniform(0.7, 0.95, count)).astype(int)
+    
+    # Scheduled dates fall within the current year
+    start_date, days = _year_span()
+    offsets = rng.integers(0, days, count)
+    
+    return [
+        {
             "id": f"ACT-{i+1000}",
             "title": title,
             "type": activity_type,
-            "duration_hours": round(duration, 1),
+            "duration_hours": duration,
             "competency_area": competency,
-            "scheduled_date": random_date(),
+            "scheduled_date": start_date + timedelta(days=offset),
             "capacity": capacity,
-            "registrations": registrations,
-            "completion_count": completions
+            "registrations": registered,
+            "completion_count": completed
         }
-        activities.append(activity)
-    
-    return activities
+        for i, (title, activity_type, duration, competency, offset, capacity, registered, completed) in enumerate(zip(
+            titles.tolist(), types.tolist(), durations.tolist(), competencies.tolist(), offsets.tolist(),
+            capacities.tolist(), registrations.tolist(), completions.tolist()
+        ))
+    ]
 
 # Mock learning plan data
-def get_learning_plan_data():
-    """Get mock learning plan data"""
+@ttl_cache(ttl=300)
+def get_learning_plan_data(seed: Optional[int] = None):
+    """Get mock learning plan data; a fixed ``seed`` makes it reproducible"""
+    rng = np.random.default_rng(seed)
     glds = [
         {"id": "GLD001", "name": "John Smith", "department": "Technology"},
         {"id": "GLD002", "name": "Sarah Johnson", "department": "Operations"},
@@ -82,8 +129,8 @@ def get_learning_plan_data():
     learning_plans = []
     for gld in glds:
         # Generate different numbers of activities for different GLDs
-        activity_count = random.randint(30, 70)
-        activities = generate_learning_activities(activity_count)
+        activity_count = int(rng.integers(30, 71))
+        activities = generate_learning_activities(activity_count, rng)
         
         learning_plan = {
             "gld_id": gld["id"],
@@ -96,8 +143,47 @@ def get_learning_plan_data():
     return learning_plans
 
 # Mock iEvolve data
-def get_ievolve_data():
-    """Get mock data from iEvolve system"""
+@ttl_cache(ttl=300)
+def _build_employees(frameworks_key, employee_count, seed):
+    """Generate employee competency records for hashable framework definitions"""
+    rng = np.random.default_rng(seed)
+    departments = ("Technology", "Operations", "Finance", "Marketing", "HR")
+    competencies = [
+        (competency_name, framework_name, levels)
+        for framework_name, framework_competencies in frameworks_key
+        for competency_name, levels in framework_competencies
+    ]
+    
+    # Draw every random decision up front: department, which competencies
+    # each employee holds (50% chance each), the level and the assessment date
+    shape = (employee_count, len(competencies))
+    department_idx = rng.integers(0, len(departments), employee_count).tolist()
+    has_competency = rng.random(shape) > 0.5
+    level_draws = rng.random(shape)
+    assessed_dates = random_dates(employee_count * len(competencies), rng)
+    
+    employees = []
+    for i in range(employee_count):
+        row = i * len(competencies)
+        employees.append({
+            "id": f"EMP{i+1000}",
+            "department": departments[department_idx[i]],
+            "competencies": [
+                {
+                    "name": competencies[j][0],
+                    "framework": competencies[j][1],
+                    "level": competencies[j][2][int(level_draws[i, j] * len(competencies[j][2]))],
+                    "last_assessed": assessed_dates[row + j]
+                }
+                for j in np.flatnonzero(has_competency[i]).tolist()
+            ]
+        })
+    
+    return employees
+
+@ttl_cache(ttl=300)
+def get_ievolve_data(seed: Optional[int] = None):
+    """Get mock data from iEvolve system; a fixed ``seed`` makes it reproducible"""
     competency_frameworks = [
         {
             "name": "Technical Skills Framework",
@@ -127,27 +213,11 @@ def get_ievolve_data():
     ]
     
     # Generate employee competency data
-    employee_count = 500
-    employees = []
-    for i in range(employee_count):
-        employee = {
-            "id": f"EMP{i+1000}",
-            "department": random.choice(["Technology", "Operations", "Finance", "Marketing", "HR"]),
-            "competencies": []
-        }
-        
-        # Assign random competencies to each employee
-        for framework in competency_frameworks:
-            for competency in framework["competencies"]:
-                if random.random() > 0.5:  # 50% chance of having this competency
-                    employee["competencies"].append({
-                        "name": competency["name"],
-                        "framework": framework["name"],
-                        "level": random.choice(competency["levels"]),
-                        "last_assessed": random_date().strftime("%Y-%m-%d")
-                    })
-        
-        employees.append(employee)
+    frameworks_key = tuple(
+        (framework["name"], tuple((competency["name"], tuple(competency["levels"])) for competency in framework["competencies"]))
+        for framework in competency_frameworks
+    )
+    employees = _build_employees(frameworks_key, 500, seed)
     
     return {
         "frameworks": competency_frameworks,
@@ -155,8 +225,10 @@ def get_ievolve_data():
     }
 
 # Mock iGlance data
-def get_iglance_data():
-    """Get mock data from iGlance system"""
+@ttl_cache(ttl=300)
+def get_iglance_data(seed: Optional[int] = None):
+    """Get mock data from iGlance system; a fixed ``seed`` makes it reproducible"""
+    rng = random.Random(seed)
     departments = ["Technology", "Operations", "Finance", "Marketing", "HR"]
     learning_metrics = []
     
@@ -167,15 +239,15 @@ def get_iglance_data():
                 "department": department,
                 "quarter": f"Q{quarter}",
                 "metrics": {
-                    "total_learning_hours": random.randint(1000, 3000),
-                    "vilt_sessions": random.randint(20, 50),
-                    "ilt_sessions": random.randint(5, 20),
-                    "average_completion_rate": round(random.uniform(0.7, 0.95), 2),
-                    "average_satisfaction_score": round(random.uniform(3.5, 4.8), 1),
+                    "total_learning_hours": rng.randint(1000, 3000),
+                    "vilt_sessions": rng.randint(20, 50),
+                    "ilt_sessions": rng.randint(5, 20),
+                    "average_completion_rate": round(rng.uniform(0.7, 0.95), 2),
+                    "average_satisfaction_score": round(rng.uniform(3.5, 4.8), 1),
                     "competency_improvement": {
-                        "Technical": round(random.uniform(0.1, 0.3), 2),
-                        "Soft Skills": round(random.uniform(0.1, 0.3), 2),
-                        "Leadership": round(random.uniform(0.1, 0.3), 2)
+                        "Technical": round(rng.uniform(0.1, 0.3), 2),
+                        "Soft Skills": round(rng.uniform(0.1, 0.3), 2),
+                        "Leadership": round(rng.uniform(0.1, 0.3), 2)
                     }
                 }
             }
@@ -183,12 +255,14 @@ def get_iglance_data():
     
     return {
         "learning_metrics": learning_metrics,
-        "current_year": datetime.now().year
+        "current_year": _CURRENT_YEAR
     }
 
 # Mock AFTD (Advanced Framework for Talent Development) data
-def get_aftd_data():
-    """Get mock data from AFTD system"""
+@ttl_cache(ttl=300)
+def get_aftd_data(seed: Optional[int] = None):
+    """Get mock data from AFTD system; a fixed ``seed`` makes it reproducible"""
+    rng = random.Random(seed)
     skill_gap_analysis = []
     departments = ["Technology", "Operations", "Finance", "Marketing", "HR"]
     skill_areas = [
@@ -205,21 +279,14 @@ def get_aftd_data():
         
         # Generate skill gaps for each department
         for skill in skill_areas:
-            if random.random() > 0.3:  # 70% chance of having a gap in this skill
+            if rng.random() > 0.3:  # 70% chance of having a gap in this skill
                 gap = {
                     "skill": skill,
-                    "current_level": round(random.uniform(1.0, 3.5), 1),
-                    "target_level": round(random.uniform(3.5, 5.0), 1),
-                    "gap": round(random.uniform(0.5, 2.0), 1),
-                    "priority": random.choice(["Low", "Medium", "High"]),
-                    "recommended_courses": random.sample([
-                        "Python Programming Fundamentals", "Advanced Java Development", 
-                        "Cloud Architecture Principles", "DevOps Essentials",
-                        "Effective Communication", "Leadership Skills", 
-                        "Project Management", "Agile Methodologies",
-                        "Data Science Basics", "Machine Learning Fundamentals",
-                        "Cybersecurity Essentials", "Blockchain Technology"
-                    ], random.randint(1, 3))
+                    "current_level": round(rng.uniform(1.0, 3.5), 1),
+                    "target_level": round(rng.uniform(3.5, 5.0), 1),
+                    "gap": round(rng.uniform(0.5, 2.0), 1),
+                    "priority": rng.choice(["Low", "Medium", "High"]),
+                    "recommended_courses": rng.sample(COURSE_CATALOG, rng.randint(1, 3))
                 }
                 department_gaps["skill_gaps"].append(gap)
         
@@ -231,8 +298,10 @@ def get_aftd_data():
     }
 
 # Mock Internal Internship data
-def get_internal_internship_data():
-    """Get mock data from Internal Internship system"""
+@ttl_cache(ttl=300)
+def get_internal_internship_data(seed: Optional[int] = None):
+    """Get mock data from Internal Internship system; a fixed ``seed`` makes it reproducible"""
+    rng = random.Random(seed)
     internship_programs = [
         {
             "id": "INT001",
@@ -241,9 +310,9 @@ def get_internal_internship_data():
             "department": "Technology",
             "skills_developed": ["Python", "Data Analysis", "Machine Learning"],
             "capacity": 20,
-            "current_participants": random.randint(10, 20),
-            "completion_rate": round(random.uniform(0.7, 0.95), 2),
-            "satisfaction_score": round(random.uniform(3.5, 4.8), 1)
+            "current_participants": rng.randint(10, 20),
+            "completion_rate": round(rng.uniform(0.7, 0.95), 2),
+            "satisfaction_score": round(rng.uniform(3.5, 4.8), 1)
         },
         {
             "id": "INT002",
@@ -252,9 +321,9 @@ def get_internal_internship_data():
             "department": "Technology",
             "skills_developed": ["AWS", "Azure", "DevOps"],
             "capacity": 15,
-            "current_participants": random.randint(8, 15),
-            "completion_rate": round(random.uniform(0.7, 0.95), 2),
-            "satisfaction_score": round(random.uniform(3.5, 4.8), 1)
+            "current_participants": rng.randint(8, 15),
+            "completion_rate": round(rng.uniform(0.7, 0.95), 2),
+            "satisfaction_score": round(rng.uniform(3.5, 4.8), 1)
         },
         {
             "id": "INT003",
@@ -263,9 +332,9 @@ def get_internal_internship_data():
             "department": "Finance",
             "skills_developed": ["Financial Modeling", "Data Analysis", "Reporting"],
             "capacity": 12,
-            "current_participants": random.randint(6, 12),
-            "completion_rate": round(random.uniform(0.7, 0.95), 2),
-            "satisfaction_score": round(random.uniform(3.5, 4.8), 1)
+            "current_participants": rng.randint(6, 12),
+            "completion_rate": round(rng.uniform(0.7, 0.95), 2),
+            "satisfaction_score": round(rng.uniform(3.5, 4.8), 1)
         },
         {
             "id": "INT004",
@@ -274,15 +343,15 @@ def get_internal_internship_data():
             "department": "Operations",
             "skills_developed": ["Project Planning", "Agile", "Stakeholder Management"],
             "capacity": 10,
-            "current_participants": random.randint(5, 10),
-            "completion_rate": round(random.uniform(0.7, 0.95), 2),
-            "satisfaction_score": round(random.uniform(3.5, 4.8), 1)
+            "current_participants": rng.randint(5, 10),
+            "completion_rate": round(rng.uniform(0.7, 0.95), 2),
+            "satisfaction_score": round(rng.uniform(3.5, 4.8), 1)
         }
     ]
     
     return {
         "internship_programs": internship_programs,
-        "current_year": datetime.now().year
+        "current_year": _CURRENT_YEAR
     }
 
 # Test function
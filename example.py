@@ -6,15 +6,8 @@ Example script to demonstrate the AOP Target Agent system.
 This script shows how to use the agent system with sample AOP targets.
 """
 
-import json
 import sys
 
-# Add the parent directory to the Python path
-sys.path.append('/media/sf_Budgie_1/agenticLab')
-
-# Import the run_aop_target_agent function
-from aop_target_agent import run_aop_target_agent
-
 def main():
     """Run the AOP Target Agent with sample data"""
     
@@ -43,6 +36,12 @@ def main():
     
     print("\nRunning AOP Target Agent...")
     
+    # Import the agent only once it is needed so the banner above is not
+    # held up by the package's imports; the parent directory holds the package
+    sys.path.append('/media/sf_Budgie_1/agenticLab')
+    from aop_target_agent import run_aop_target_agent
+    from aop_target_agent.models import dump_results
+    
     # Run the agent with mock mode enabled
     result = run_aop_target_agent(aop_targets, mock_mode=True)
     
@@ -89,8 +88,8 @@ def main():
     save_option = input("\nWould you like to save the full results to a JSON file? (y/n): ")
     if save_option.lower() == 'y':
         filename = "aop_target_analysis_results.json"
-        with open(filename, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(dump_results(result, indent=2))
         print(f"Results saved to {filename}")
     
     print("\nThank you for using the AOP Target Breakdown Agent!")
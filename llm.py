@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+LLM wrappers for the AOP Target Breakdown Agent.
+These wrappers add response caching, provider fallback and connection
+pooling on top of the crewAI LLM clients. Both wrappers compose existing
+LLM instances rather than subclassing crewAI's LLM, whose constructor hands
+recognised models off to native provider classes.
+"""
+
+import json
+import time
+import atexit
+import asyncio
+import hashlib
+import importlib
+import importlib.util
+import logging
+import threading
+import functools
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import Field
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+
+logger = logging.getLogger(__name__)
+
+# Model the agents run on
+PRIMARY_MODEL = "gpt-4o-mini"
+# Models tried in order when the primary model fails with a transient error
+FALLBACK_MODELS = ("claude-3-haiku-20240307", "gpt-3.5-turbo")
+
+def _close_async_client(client):
+    """Close an httpx.AsyncClient at interpreter exit"""
+    try:
+        asyncio.run(client.aclose())
+    except RuntimeError:
+        # An event loop is still running; the OS reclaims the sockets
+        pass
+
+@functools.lru_cache(maxsize=1)
+def configure_http_clients():
+    """Share one pooled HTTP client pair across all litellm calls.
+
+    litellm otherwise opens fresh connections, paying TCP and TLS setup on
+    every call. This only affects models routed through litellm; crewAI's
+    native provider SDKs (OpenAI, Anthropic, ...) keep their own clients.
+    HTTP/2 is used when the optional ``h2`` package is installed, with a
+    fallback to pooled HTTP/1.1. Safe to call repeatedly; the clients are
+    created once.
+    """
+    try:
+        import httpx
+        import litellm
+    except ImportError:
+        # Native crewAI providers manage their own connections
+        return
+    
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    client = httpx.Client(http2=http2, limits=limits, timeout=60.0)
+    async_client = httpx.AsyncClient(http2=http2, limits=limits, timeout=60.0)
+    litellm.client_session = client
+    litellm.aclient_session = async_client
+    atexit.register(client.close)
+    atexit.register(_close_async_client, async_client)
+
+@functools.lru_cache(maxsize=1)
+def _transient_errors() -> Tuple[type, ...]:
+    """Exception types that should move on to the next model"""
+    errors: Tuple[type, ...] = (TimeoutError, ConnectionError)
+    try:
+        from litellm.exceptions import (
+            APIConnectionError,
+            InternalServerError,
+            RateLimitError,
+            ServiceUnavailableError,
+            Timeout
+        )
+        errors += (RateLimitError, Timeout, APIConnectionError, ServiceUnavailableError, InternalServerError)
+    except ImportError:
+        pass
+    
+    # Native provider SDKs raise their own error types
+    for module_name in ("openai", "anthropic"):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        errors += (module.RateLimitError, module.APITimeoutError, module.APIConnectionError, module.InternalServerError)
+    return errors
+
+class _WrappedLLM(BaseLLM):
+    """Base for LLMs that delegate to another LLM instance.
+
+    Model capabilities are answered by the delegate, and per-call stop
+    words set on the wrapper are forwarded to it.
+    """
+    llm: Any = Field(description="The LLM calls are delegated to")
+
+    def __init__(self, llm: BaseLLM, **kwargs):
+        kwargs.setdefault("model", llm.model)
+        kwargs.setdefault("temperature", llm.temperature)
+        super().__init__(llm=llm, **kwargs)
+
+    def _call(self, llm, messages, tools, callbacks, available_functions, from_task, from_agent, response_model):
+        """Call ``llm`` with this wrapper's active stop words"""
+        with call_stop_override(llm, list(self.stop_sequences)):
+            return llm.call(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+
+    async def _acall(self, llm, messages, tools, callbacks, available_functions, from_task, from_agent, response_model):
+        """Async counterpart of _call()"""
+        with call_stop_override(llm, list(self.stop_sequences)):
+            return await llm.acall(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+
+    def supports_function_calling(self) -> bool:
+        supports = getattr(self.llm, "supports_function_calling", None)
+        return bool(supports and supports())
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
+
+    def supports_multimodal(self) -> bool:
+        return self.llm.supports_multimodal()
+
+class CachedLLM(_WrappedLLM):
+    """LLM wrapper that memoizes deterministic responses in process memory.
+
+    Responses are keyed on the model, messages, tools and stop words of each
+    call and are only cached when the wrapped LLM samples at temperature 0;
+    an unset temperature leaves sampling to the provider default.
+    """
+    cache_ttl: ClassVar[float] = 3600.0
+    cache_maxsize: ClassVar[int] = 1024
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+
+    _cache: ClassVar["OrderedDict[str, Tuple[float, Any]]"] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def _cache_key(self, messages: Any, tools: Optional[List[Dict[str, Any]]], response_model: Any) -> Optional[str]:
+        """Build a stable hash for a call, or None when it must not be cached"""
+        if self.llm.temperature != 0:
+            return None
+        payload = json.dumps(
+            {
+                "model": self.llm.model,
+                "messages": messages,
+                "tools": tools or [],
+                "stop": self.stop_sequences,
+                "response_model": getattr(response_model, "__qualname__", None)
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(True, response)`` for a fresh cache entry"""
+        now = time.monotonic()
+        with CachedLLM._cache_lock:
+            entry = CachedLLM._cache.get(key)
+            if entry is not None and now - entry[0] < self.cache_ttl:
+                CachedLLM._cache.move_to_end(key)
+                CachedLLM.hits += 1
+                return True, entry[1]
+            CachedLLM.misses += 1
+        return False, None
+
+    def _store(self, key: str, response: Any):
+        """Cache a response, evicting the least recently used entries"""
+        with CachedLLM._cache_lock:
+            CachedLLM._cache[key] = (time.monotonic(), response)
+            CachedLLM._cache.move_to_end(key)
+            while len(CachedLLM._cache) > self.cache_maxsize:
+                CachedLLM._cache.popitem(last=False)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        """Return a cached response when available, otherwise call the model"""
+        key = self._cache_key(messages, tools, response_model)
+        if key is not None:
+            hit, response = self._lookup(key)
+            if hit:
+                return response
+        
+        response = self._call(self.llm, messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        if key is not None:
+            self._store(key, response)
+        return response
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        """Async counterpart of call()"""
+        key = self._cache_key(messages, tools, response_model)
+        if key is not None:
+            hit, response = self._lookup(key)
+            if hit:
+                return response
+        
+        response = await self._acall(self.llm, messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        if key is not None:
+            self._store(key, response)
+        return response
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached responses and reset the hit/miss counters"""
+        with CachedLLM._cache_lock:
+            CachedLLM._cache.clear()
+            CachedLLM.hits = 0
+            CachedLLM.misses = 0
+
+class FallbackLLM(_WrappedLLM):
+    """LLM wrapper that retries on the next model when a provider call fails.
+
+    Rate limits, timeouts, connection errors and 5xx responses move on to
+    the next LLM in ``fallbacks``; any other error is raised immediately.
+    The happy path is a single call to the primary LLM.
+    """
+    fallbacks: List[Any] = Field(default_factory=list, description="LLMs to try, in order, after the primary model")
+
+    def __init__(self, primary: BaseLLM, fallbacks: Sequence[BaseLLM] = (), **kwargs):
+        super().__init__(primary, fallbacks=list(fallbacks), **kwargs)
+
+    @property
+    def primary(self) -> BaseLLM:
+        """The LLM tried first"""
+        return self.llm
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        """Call the primary model, falling back on transient provider errors"""
+        transient = _transient_errors()
+        try:
+            return self._call(self.llm, messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        except transient as e:
+            last_error = e
+        
+        for fallback in self.fallbacks:
+            logger.warning("LLM call failed (%r), falling back to %s", last_error, fallback.model)
+            try:
+                return self._call(fallback, messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+            except transient as e:
+                last_error = e
+        
+        raise last_error
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        """Async counterpart of call()"""
+        transient = _transient_errors()
+        try:
+            return await self._acall(self.llm, messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        except transient as e:
+            last_error = e
+        
+        for fallback in self.fallbacks:
+            logger.warning("LLM call failed (%r), falling back to %s", last_error, fallback.model)
+            try:
+                return await self._acall(fallback, messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+            except transient as e:
+                last_error = e
+        
+        raise last_error
+
+class MockLLM(BaseLLM):
+    """Offline stand-in for the agents' LLM in mock mode.
+
+    Every call returns a canned final answer without contacting a provider,
+    so mock runs cost nothing even when API keys are configured.
+    """
+    response: str = Field(default="Final Answer: Mock response", description="Text returned for every call")
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("model", "mock")
+        super().__init__(**kwargs)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        """Return the canned response"""
+        return self.response
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        """Async counterpart of call()"""
+        return self.response
+
+def _deterministic_llm(model: str) -> Optional[CachedLLM]:
+    """Cached temperature-0 LLM for ``model``, or None when its provider is not installed"""
+    try:
+        return CachedLLM(LLM(model=model, temperature=0))
+    except ImportError as e:
+        logger.warning("Skipping model %s: %s", model, e)
+        return None
+
+def build_llm(model: str = PRIMARY_MODEL, fallback_models: Sequence[str] = FALLBACK_MODELS) -> FallbackLLM:
+    """Build the agents' LLM: a cached primary model with cached fallbacks.
+
+    Fallback models whose provider package is not installed are skipped.
+    """
+    fallbacks = [llm for llm in map(_deterministic_llm, fallback_models) if llm is not None]
+    return FallbackLLM(CachedLLM(LLM(model=model, temperature=0)), fallbacks)
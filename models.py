@@ -6,63 +6,101 @@ Data models for the AOP Target Breakdown Agent system.
 These models define the structure of data used throughout the system.
 """
 
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+import functools
+import dataclasses
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 
 class AOPTarget(BaseModel):
     """Annual Operating Plan (AOP) Target model"""
+    model_config = ConfigDict(frozen=True)
+    
     vilt_target: int = Field(..., description="Target number of Virtual Instructor-Led Training (VILT) sessions")
     ilt_target: int = Field(..., description="Target number of Instructor-Led Training (ILT) sessions")
     learning_hours_target: int = Field(..., description="Target total learning hours")
     competency_targets: Dict[str, int] = Field(..., description="Targets for different competency areas")
 
-class LearningActivity(BaseModel):
+# Plans hold many activities and only aggregate over them, so activities are
+# a plain slotted dataclass rather than a full BaseModel. Direct construction
+# is for trusted internal data and skips validation; raw input is validated
+# (and extra fields rejected) where it enters a LearningPlan.
+@dataclasses.dataclass(frozen=True, slots=True)
+class LearningActivity:
     """Model for a specific learning activity (VILT or ILT)"""
-    id: str = Field(..., description="Unique identifier for the learning activity")
-    title: str = Field(..., description="Title of the learning activity")
-    type: str = Field(..., description="Type of learning activity (VILT or ILT)")
-    duration_hours: float = Field(..., description="Duration in hours")
-    competency_area: str = Field(..., description="Primary competency area addressed")
-    scheduled_date: datetime = Field(..., description="Scheduled date and time")
-    capacity: int = Field(..., description="Maximum number of participants")
-    registrations: int = Field(0, description="Current number of registrations")
-    completion_count: int = Field(0, description="Number of participants who completed the activity")
+    __pydantic_config__ = ConfigDict(extra="forbid")
+    
+    id: str  # Unique identifier for the learning activity
+    title: str  # Title of the learning activity
+    type: str  # Type of learning activity (VILT or ILT)
+    duration_hours: float  # Duration in hours
+    competency_area: str  # Primary competency area addressed
+    scheduled_date: datetime  # Scheduled date and time
+    capacity: int  # Maximum number of participants
+    registrations: int = 0  # Current number of registrations
+    completion_count: int = 0  # Number of participants who completed the activity
 
 class LearningPlan(BaseModel):
     """Learning Plan model containing scheduled learning activities"""
+    # Frozen so the cached aggregates can never go stale
+    model_config = ConfigDict(frozen=True)
+    
     gld_id: str = Field(..., description="Group Learning Director (GLD) identifier")
     gld_name: str = Field(..., description="GLD name")
     department: str = Field(..., description="Department or business unit")
-    activities: List[LearningActivity] = Field([], description="List of scheduled learning activities")
+    activities: Tuple[LearningActivity, ...] = Field((), description="Scheduled learning activities")
+    
+    @functools.cached_property
+    def _aggregates(self) -> Tuple[int, int, float, Dict[str, float]]:
+        """VILT count, ILT count, learning hours and hours by competency.
+
+        Activities are unpacked once into parallel NumPy columns so the
+        sums run as vectorized reductions instead of Python loops. The plan
+        is immutable, so this is computed at most once per plan.
+        """
+        count = len(self.activities)
+        if not count:
+            return 0, 0, 0.0, {}
+        types = np.array([activity.type for activity in self.activities])
+        duration = np.fromiter((activity.duration_hours for activity in self.activities), dtype=np.float64, count=count)
+        completions = np.fromiter((activity.completion_count for activity in self.activities), dtype=np.float64, count=count)
+        # Competency areas keep the order they first appear in
+        area_index = {}
+        area_codes = np.fromiter(
+            (area_index.setdefault(activity.competency_area, len(area_index)) for activity in self.activities),
+            dtype=np.intp,
+            count=count
+        )
+        
+        hours = duration * completions
+        area_hours = np.bincount(area_codes, weights=hours, minlength=len(area_index))
+        return (
+            int(np.count_nonzero(types == "VILT")),
+            int(np.count_nonzero(types == "ILT")),
+            float(hours.sum()),
+            dict(zip(area_index, area_hours.tolist()))
+        )
     
     @property
     def total_vilt_count(self) -> int:
         """Total number of VILT sessions in the plan"""
-        return sum(1 for activity in self.activities if activity.type == "VILT")
+        return self._aggregates[0]
     
     @property
     def total_ilt_count(self) -> int:
         """Total number of ILT sessions in the plan"""
-        return sum(1 for activity in self.activities if activity.type == "ILT")
+        return self._aggregates[1]
     
     @property
     def total_learning_hours(self) -> float:
         """Total learning hours in the plan"""
-        return sum(activity.duration_hours * activity.completion_count for activity in self.activities)
+        return self._aggregates[2]
     
     @property
     def competency_hours(self) -> Dict[str, float]:
         """Learning hours by competency area"""
-        result = {}
-        for activity in self.activities:
-            area = activity.competency_area
-            hours = activity.duration_hours * activity.completion_count
-            if area in result:
-                result[area] += hours
-            else:
-                result[area] = hours
-        return result
+        return self._aggregates[3]
 
 class TimeframeTasks(BaseModel):
     """Tasks broken down by timeframe"""
@@ -127,3 +165,12 @@ class DiagnosticReport(BaseModel):
     future_risks: List[str] = Field([], description="Potential future risks")
     recommendations: List[str] = Field([], description="Recommendations for improvement")
     competency_analysis: Dict[str, Any] = Field({}, description="Detailed analysis by competency area")
+
+# The agent returns plain dicts whose shape varies between mock and crew
+# output, so results are serialized through one prebuilt adapter rather
+# than per-section models
+_RESULTS_ADAPTER = TypeAdapter(Dict[str, Any])
+
+def dump_results(results: Dict[str, Any], indent: Optional[int] = None) -> bytes:
+    """Serialize agent results to JSON bytes with a reusable compiled serializer"""
+    return _RESULTS_ADAPTER.dump_json(results, indent=indent)
@@ -15,32 +15,37 @@ import sys
 import os
 from datetime import datetime
 
+# Mock distribution of the annual targets
+_QUARTER_NAMES = ("Q1", "Q2", "Q3", "Q4")
+_QUARTER_WEIGHTS = (0.2, 0.3, 0.3, 0.2)
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+_MONTH_WEIGHTS = (0.07, 0.07, 0.06, 0.08, 0.09, 0.13, 0.09, 0.08, 0.09, 0.08, 0.08, 0.08)
+
 # Define functions to generate mock data directly in the app
-def generate_mock_results(aop_targets):
-    """Generate mock results for demonstration purposes"""
+@st.cache_data(show_spinner=False)
+def generate_mock_results(vilt_target, ilt_target, learning_hours_target, competency_targets=()):
+    """Generate mock results for demonstration purposes.
+
+    Arguments are plain values (competency targets as ``(name, hours)``
+    pairs) so the result can be cached across reruns.
+    """
     
     # Mock target breakdown
     target_breakdown = {
-        "annual": aop_targets,
+        "annual": {
+            "vilt_target": vilt_target,
+            "ilt_target": ilt_target,
+            "learning_hours_target": learning_hours_target,
+            "competency_targets": dict(competency_targets)
+        },
         "quarterly": [
-            {"quarter": "Q1", "vilt_target": aop_targets["vilt_target"] * 0.2, "ilt_target": aop_targets["ilt_target"] * 0.2},
-            {"quarter": "Q2", "vilt_target": aop_targets["vilt_target"] * 0.3, "ilt_target": aop_targets["ilt_target"] * 0.3},
-            {"quarter": "Q3", "vilt_target": aop_targets["vilt_target"] * 0.3, "ilt_target": aop_targets["ilt_target"] * 0.3},
-            {"quarter": "Q4", "vilt_target": aop_targets["vilt_target"] * 0.2, "ilt_target": aop_targets["ilt_target"] * 0.2}
+            {"quarter": quarter, "vilt_target": vilt_target * weight, "ilt_target": ilt_target * weight}
+            for quarter, weight in zip(_QUARTER_NAMES, _QUARTER_WEIGHTS)
         ],
         "monthly": [
-            {"month": "January", "vilt_target": aop_targets["vilt_target"] * 0.07, "ilt_target": aop_targets["ilt_target"] * 0.07},
-            {"month": "February", "vilt_target": aop_targets["vilt_target"] * 0.07, "ilt_target": aop_targets["ilt_target"] * 0.07},
-            {"month": "March", "vilt_target": aop_targets["vilt_target"] * 0.06, "ilt_target": aop_targets["ilt_target"] * 0.06},
-            {"month": "April", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "May", "vilt_target": aop_targets["vilt_target"] * 0.09, "ilt_target": aop_targets["ilt_target"] * 0.09},
-            {"month": "June", "vilt_target": aop_targets["vilt_target"] * 0.13, "ilt_target": aop_targets["ilt_target"] * 0.13},
-            {"month": "July", "vilt_target": aop_targets["vilt_target"] * 0.09, "ilt_target": aop_targets["ilt_target"] * 0.09},
-            {"month": "August", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "September", "vilt_target": aop_targets["vilt_target"] * 0.09, "ilt_target": aop_targets["ilt_target"] * 0.09},
-            {"month": "October", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "November", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08},
-            {"month": "December", "vilt_target": aop_targets["vilt_target"] * 0.08, "ilt_target": aop_targets["ilt_target"] * 0.08}
+            {"month": month, "vilt_target": vilt_target * weight, "ilt_target": ilt_target * weight}
+            for month, weight in zip(_MONTH_NAMES, _MONTH_WEIGHTS)
         ],
         # Add weekly and daily data similar to your app.py file
         # ...
@@ -57,9 +62,15 @@ def generate_mock_results(aop_targets):
     }
 
 # Define a wrapper for run_aop_target_agent
+@st.cache_data(ttl=3600)
 def run_aop_target_agent(aop_targets, mock_mode=True):
     """Wrapper function to run the AOP Target Agent"""
-    return generate_mock_results(aop_targets)
+    return generate_mock_results(
+        aop_targets["vilt_target"],
+        aop_targets["ilt_target"],
+        aop_targets.get("learning_hours_target", 0),
+        tuple(aop_targets.get("competency_targets", {}).items())
+    )
 
 # Main Streamlit app code
 def main():
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Tests for the agent entry points.
+"""
+
+import json
+import time
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from aop_target_agent import aop_target_agent as agent
+from aop_target_agent.aop_target_agent import _run_async
+
+async def _answer():
+    await asyncio.sleep(0)
+    return 42
+
+def test_run_async_without_running_loop():
+    assert _run_async(_answer()) == 42
+
+def test_run_async_inside_running_loop():
+    async def caller():
+        # Synchronous API called from async code, as in Jupyter
+        return _run_async(_answer())
+    
+    assert asyncio.run(caller()) == 42
+
+TARGETS = {
+    "vilt_target": 500,
+    "ilt_target": 200,
+    "learning_hours_target": 10000,
+    "competency_targets": {"technical": 6000, "leadership": 4000}
+}
+
+@pytest.fixture
+def no_provider_calls(monkeypatch):
+    """Fail the test if any native OpenAI call is attempted"""
+    from crewai.llms.providers.openai.completion import OpenAICompletion
+    
+    def _fail(*args, **kwargs):
+        raise AssertionError("provider called in mock mode")
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(OpenAICompletion, "call", _fail)
+    monkeypatch.setattr(OpenAICompletion, "acall", _fail)
+
+def test_mock_run_skips_crew(monkeypatch, no_provider_calls):
+    def _fail(**kwargs):
+        raise AssertionError("crew built in mock mode")
+    
+    monkeypatch.setattr(agent, "create_agents", _fail)
+    agent.reset_crew_cache()
+    
+    assert agent.run_aop_target_agent(TARGETS, mock_mode=True) == agent.generate_mock_results(TARGETS)
+    assert agent.run_aop_target_agent_batch([TARGETS, TARGETS], mock_mode=True) == [agent.generate_mock_results(TARGETS)] * 2
+    assert asyncio.run(agent.run_many([TARGETS], mock_mode=True)) == [agent.generate_mock_results(TARGETS)]
+
+def test_mock_agents_use_offline_llm(no_provider_calls):
+    from aop_target_agent.llm import MockLLM
+    
+    crew = agent.create_agents(mock_mode=True)
+    
+    for crew_agent in crew.agents:
+        assert isinstance(crew_agent.llm, MockLLM)
+        assert crew_agent.llm.call([{"role": "user", "content": "hi"}]) == "Final Answer: Mock response"
+
+def test_get_crew_builds_once_across_threads(monkeypatch):
+    built = []
+    
+    def _create_agents(**kwargs):
+        time.sleep(0.01)
+        built.append(kwargs)
+        return object()
+    
+    monkeypatch.setattr(agent, "create_agents", _create_agents)
+    agent.reset_crew_cache()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            crews = list(executor.map(lambda _: agent.get_crew(mock_mode=False), range(8)))
+    finally:
+        agent.reset_crew_cache()
+    
+    assert len(built) == 1
+    assert all(crew is crews[0] for crew in crews)
+
+class _FakeCrew:
+    """Answers each batch with one entry per target, failing the ``fail_on`` kickoffs"""
+    
+    def __init__(self, fail_on=()):
+        self.fail_on = fail_on
+        self.kickoffs = 0
+    
+    def copy(self):
+        return self
+    
+    def kickoff(self, inputs):
+        self.kickoffs += 1
+        if self.kickoffs in self.fail_on:
+            raise RuntimeError("provider unavailable")
+        return json.dumps([{"vilt_target": t["vilt_target"]} for t in inputs["aop_targets"]])
+
+def test_batch_returns_one_answer_per_target(monkeypatch):
+    crew = _FakeCrew(fail_on=(2,))
+    monkeypatch.setattr(agent, "get_crew", lambda **kwargs: crew)
+    targets = [dict(TARGETS, vilt_target=i) for i in range(5)]
+    
+    results = agent.run_aop_target_agent_batch(targets, batch_size=2, mock_mode=False)
+    
+    assert crew.kickoffs == 3
+    assert results == [{"vilt_target": 0}, {"vilt_target": 1}, None, None, {"vilt_target": 4}]
+
+def test_mock_breakdown_periods_sum_to_annual_targets():
+    breakdown = agent.generate_mock_results(TARGETS)["target_breakdown"]
+    
+    for period in ("quarterly", "monthly", "weekly"):
+        assert sum(row["vilt_target"] for row in breakdown[period]) == pytest.approx(TARGETS["vilt_target"])
+        assert sum(row["ilt_target"] for row in breakdown[period]) == pytest.approx(TARGETS["ilt_target"])
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Tests for the LLM wrappers.
+"""
+
+import sys
+import types
+
+import httpx
+import openai
+import pytest
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+
+from aop_target_agent.llm import CachedLLM, FallbackLLM, configure_http_clients
+
+class EchoLLM(BaseLLM):
+    """Fake model that numbers its responses"""
+    calls: int = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        return f"response {self.calls}"
+
+class RateLimitedLLM(BaseLLM):
+    """Fake model that is always rate limited"""
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        raise openai.RateLimitError("rate limited", response=httpx.Response(429, request=request), body=None)
+
+class BrokenLLM(BaseLLM):
+    """Fake model that fails with a non-transient error"""
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        raise ValueError("bad request")
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    CachedLLM.clear_cache()
+    yield
+    CachedLLM.clear_cache()
+
+def test_identical_call_is_cache_hit():
+    model = EchoLLM(model="echo", temperature=0)
+    llm = CachedLLM(model)
+    
+    assert llm.call("Break down the targets") == "response 1"
+    assert llm.call("Break down the targets") == "response 1"
+    assert model.calls == 1
+    assert (CachedLLM.hits, CachedLLM.misses) == (1, 1)
+
+def test_different_messages_miss():
+    model = EchoLLM(model="echo", temperature=0)
+    llm = CachedLLM(model)
+    
+    llm.call("first")
+    llm.call("second")
+    assert model.calls == 2
+
+def test_unset_temperature_is_not_cached():
+    model = EchoLLM(model="echo")
+    llm = CachedLLM(model)
+    
+    assert llm.call("Break down the targets") == "response 1"
+    assert llm.call("Break down the targets") == "response 2"
+    assert CachedLLM.hits == 0
+
+def test_wraps_native_provider():
+    llm = CachedLLM(LLM(model="gpt-4o-mini", temperature=0))
+    
+    assert isinstance(llm, CachedLLM)
+    assert llm.model == "gpt-4o-mini"
+
+def test_rate_limited_primary_falls_back():
+    fallback = EchoLLM(model="fallback")
+    llm = FallbackLLM(RateLimitedLLM(model="primary"), [fallback])
+    
+    assert llm.call("Break down the targets") == "response 1"
+    assert fallback.calls == 1
+
+def test_non_transient_error_is_raised():
+    fallback = EchoLLM(model="fallback")
+    llm = FallbackLLM(BrokenLLM(model="primary"), [fallback])
+    
+    with pytest.raises(ValueError):
+        llm.call("Break down the targets")
+    assert fallback.calls == 0
+
+def test_primary_success_skips_fallbacks():
+    primary = EchoLLM(model="primary")
+    fallback = EchoLLM(model="fallback")
+    llm = FallbackLLM(primary, [fallback])
+    
+    assert llm.call("Break down the targets") == "response 1"
+    assert (primary.calls, fallback.calls) == (1, 0)
+
+def test_http_clients_fall_back_without_h2(monkeypatch):
+    # h2 is an optional extra; without it the pooled clients speak HTTP/1.1
+    litellm = types.SimpleNamespace()
+    monkeypatch.setitem(sys.modules, "litellm", litellm)
+    monkeypatch.setitem(sys.modules, "h2", None)
+    configure_http_clients.cache_clear()
+    try:
+        configure_http_clients()
+    finally:
+        configure_http_clients.cache_clear()
+    
+    assert isinstance(litellm.client_session, httpx.Client)
+    assert isinstance(litellm.aclient_session, httpx.AsyncClient)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Tests for the data models.
+"""
+
+from datetime import datetime
+
+import pydantic
+import pytest
+
+from aop_target_agent.models import LearningActivity, LearningPlan
+
+def _activity(id, type, competency_area, duration_hours=2.0, completion_count=10):
+    return {
+        "id": id,
+        "title": f"Course {id}",
+        "type": type,
+        "duration_hours": duration_hours,
+        "competency_area": competency_area,
+        "scheduled_date": "2025-03-01T09:00:00",
+        "capacity": 20,
+        "registrations": 15,
+        "completion_count": completion_count
+    }
+
+def _plan(*activities):
+    return LearningPlan(gld_id="GLD001", gld_name="Jane Doe", department="Technology", activities=list(activities))
+
+def test_plan_totals():
+    plan = _plan(_activity("A1", "VILT", "technical"), _activity("A2", "ILT", "leadership", duration_hours=4.0))
+    
+    assert (plan.total_vilt_count, plan.total_ilt_count) == (1, 1)
+    assert plan.total_learning_hours == 60.0
+    assert plan.competency_hours == {"technical": 20.0, "leadership": 40.0}
+    assert list(plan.competency_hours) == ["technical", "leadership"]
+
+def test_plan_activities_cannot_change_after_totals_are_read():
+    plan = _plan(_activity("A1", "VILT", "technical"))
+    assert plan.total_vilt_count == 1
+    
+    with pytest.raises(pydantic.ValidationError):
+        plan.activities = ()
+    with pytest.raises(AttributeError):
+        plan.activities.append(plan.activities[0])
+    assert plan.total_vilt_count == 1
+
+def test_plan_validates_raw_activities():
+    plan = _plan(_activity("A1", "VILT", "technical", duration_hours="2.5"))
+    activity = plan.activities[0]
+    
+    assert isinstance(activity, LearningActivity)
+    assert activity.duration_hours == 2.5
+    assert activity.scheduled_date == datetime(2025, 3, 1, 9, 0)
+
+def test_plan_forbids_extra_activity_fields():
+    with pytest.raises(pydantic.ValidationError):
+        _plan(dict(_activity("A1", "VILT", "technical"), location="Room 1"))
+
+def test_plan_keeps_trusted_activities():
+    # Activities built internally are taken as-is, without revalidation
+    activity = LearningActivity(**dict(_activity("A1", "VILT", "technical"), scheduled_date=datetime(2025, 3, 1, 9, 0)))
+    
+    assert _plan(activity).activities[0] is activity
+
+def test_activity_is_frozen():
+    activity = LearningActivity(**_activity("A1", "VILT", "technical"))
+    
+    with pytest.raises(AttributeError):
+        activity.registrations = 20
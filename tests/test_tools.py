@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Tests for the agent tools, checked against the original loop-based
+implementations they replaced.
+"""
+
+import pytest
+
+from aop_target_agent.data_sources import get_learning_plan_data
+from aop_target_agent.tools import (
+    analyze_learning_plan,
+    assess_risk,
+    breakdown_targets,
+    calculate_gap,
+    generate_diagnostic_report,
+    identify_opportunities
+)
+
+AOP_TARGETS = {
+    "vilt_target": 500,
+    "ilt_target": 200,
+    "learning_hours_target": 10000,
+    "competency_targets": {"Technical": 6000, "Leadership": 40, "Soft Skills": 12.5, "Ethics": 10}
+}
+
+def _assert_same(actual, expected, path="result"):
+    """Assert two results are equal with identical value types throughout"""
+    assert type(actual) is type(expected), f"{path}: {type(actual).__name__} != {type(expected).__name__}"
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected), path
+        for key in expected:
+            _assert_same(actual[key], expected[key], f"{path}[{key!r}]")
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected), path
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            _assert_same(a, e, f"{path}[{i}]")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected), path
+    else:
+        assert actual == expected, path
+
+def _assert_close(actual, expected, path="result"):
+    """Assert two results are equal, allowing float rounding and int/float differences in numbers"""
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        assert isinstance(actual, (int, float)), path
+        assert actual == pytest.approx(expected), path
+    elif isinstance(expected, dict):
+        assert list(actual) == list(expected), path
+        for key in expected:
+            _assert_close(actual[key], expected[key], f"{path}[{key!r}]")
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected), path
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            _assert_close(a, e, f"{path}[{i}]")
+    else:
+        assert actual == expected, path
+
+# Reference implementations, as they stood before the tools were vectorized
+
+def _baseline_analyze_learning_plan(learning_plan_data, aop_targets):
+    total_vilt_count = 0
+    total_ilt_count = 0
+    total_learning_hours = 0
+    competency_hours = {}
+    for plan in learning_plan_data:
+        for activity in plan.get("activities", []):
+            if activity.get("type") == "VILT":
+                total_vilt_count += 1
+            elif activity.get("type") == "ILT":
+                total_ilt_count += 1
+            hours = activity.get("duration_hours", 0) * activity.get("completion_count", 0)
+            total_learning_hours += hours
+            competency = activity.get("competency_area")
+            if competency:
+                competency_hours[competency] = competency_hours.get(competency, 0) + hours
+    
+    registration_rates = []
+    completion_rates = []
+    for plan in learning_plan_data:
+        for activity in plan.get("activities", []):
+            capacity = activity.get("capacity", 0)
+            registrations = activity.get("registrations", 0)
+            completions = activity.get("completion_count", 0)
+            if capacity > 0:
+                registration_rates.append(registrations / capacity)
+            if registrations > 0:
+                completion_rates.append(completions / registrations)
+    
+    return {
+        "total_vilt_count": total_vilt_count,
+        "total_ilt_count": total_ilt_count,
+        "total_learning_hours": total_learning_hours,
+        "competency_hours": competency_hours,
+        "avg_registration_rate": sum(registration_rates) / len(registration_rates) if registration_rates else 0,
+        "avg_completion_rate": sum(completion_rates) / len(completion_rates) if completion_rates else 0,
+        "gld_breakdown": [
+            {
+                "gld_id": plan.get("gld_id"),
+                "gld_name": plan.get("gld_name"),
+                "department": plan.get("department"),
+                "vilt_count": sum(1 for activity in plan.get("activities", []) if activity.get("type") == "VILT"),
+                "ilt_count": sum(1 for activity in plan.get("activities", []) if activity.get("type") == "ILT")
+            }
+            for plan in learning_plan_data
+        ]
+    }
+
+def _baseline_calculate_gap(learning_plan_analysis, aop_targets):
+    vilt_target = aop_targets.get("vilt_target", 0)
+    ilt_target = aop_targets.get("ilt_target", 0)
+    learning_hours_target = aop_targets.get("learning_hours_target", 0)
+    competency_targets = aop_targets.get("competency_targets", {})
+    
+    vilt_scheduled = learning_plan_analysis.get("total_vilt_count", 0)
+    ilt_scheduled = learning_plan_analysis.get("total_ilt_count", 0)
+    learning_hours_scheduled = learning_plan_analysis.get("total_learning_hours", 0)
+    competency_hours = learning_plan_analysis.get("competency_hours", {})
+    
+    vilt_gap = vilt_target - vilt_scheduled
+    ilt_gap = ilt_target - ilt_scheduled
+    learning_hours_gap = learning_hours_target - learning_hours_scheduled
+    
+    competency_gaps = {}
+    for competency, target in competency_targets.items():
+        actual = competency_hours.get(competency, 0)
+        gap = target - actual
+        competency_gaps[competency] = {
+            "target": target,
+            "actual": actual,
+            "gap": gap,
+            "gap_indicator": 0 if actual >= target else gap
+        }
+    
+    return {
+        "vilt_scheduled": vilt_scheduled,
+        "vilt_gap": vilt_gap,
+        "vilt_gap_indicator": 0 if vilt_scheduled >= vilt_target else vilt_gap,
+        "ilt_scheduled": ilt_scheduled,
+        "ilt_gap": ilt_gap,
+        "ilt_gap_indicator": 0 if ilt_scheduled >= ilt_target else ilt_gap,
+        "learning_hours_scheduled": learning_hours_scheduled,
+        "learning_hours_gap": learning_hours_gap,
+        "learning_hours_gap_indicator": 0 if learning_hours_scheduled >= learning_hours_target else learning_hours_gap,
+        "competency_gaps": competency_gaps
+    }
+
+def _baseline_assess_risk(gap_analysis, learning_plan_analysis):
+    risk_factors = []
+    
+    vilt_gap = gap_analysis.get("vilt_gap", 0)
+    if vilt_gap > 0:
+        risk_factors.append({
+            "risk_area": "VILT Session Count",
+            "current_value": str(gap_analysis.get("vilt_scheduled", 0)),
+            "target_value": str(gap_analysis.get("vilt_scheduled", 0) + vilt_gap),
+            "risk_level": "High" if vilt_gap > 50 else "Medium" if vilt_gap > 20 else "Low",
+            "impact": f"May miss VILT target by {vilt_gap} sessions",
+            "mitigation": "Schedule additional VILT sessions, prioritizing high-impact courses"
+        })
+    
+    ilt_gap = gap_analysis.get("ilt_gap", 0)
+    if ilt_gap > 0:
+        risk_factors.append({
+            "risk_area": "ILT Session Count",
+            "current_value": str(gap_analysis.get("ilt_scheduled", 0)),
+            "target_value": str(gap_analysis.get("ilt_scheduled", 0) + ilt_gap),
+            "risk_level": "High" if ilt_gap > 20 else "Medium" if ilt_gap > 10 else "Low",
+            "impact": f"May miss ILT target by {ilt_gap} sessions",
+            "mitigation": "Schedule additional ILT sessions, consider converting some to VILT format"
+        })
+    
+    learning_hours_gap = gap_analysis.get("learning_hours_gap", 0)
+    if learning_hours_gap > 0:
+        risk_factors.append({
+            "risk_area": "Learning Hours",
+            "current_value": str(int(gap_analysis.get("learning_hours_scheduled", 0))),
+            "target_value": str(int(gap_analysis.get("learning_hours_scheduled", 0) + learning_hours_gap)),
+            "risk_level": "High" if learning_hours_gap > 1000 else "Medium" if learning_hours_gap > 500 else "Low",
+            "impact": f"May miss learning hours target by {int(learning_hours_gap)} hours",
+            "mitigation": "Increase session capacity and promote registration"
+        })
+    
+    for competency, gap_data in gap_analysis.get("competency_gaps", {}).items():
+        if gap_data.get("gap", 0) > 0:
+            risk_factors.append({
+                "risk_area": f"{competency} Competency",
+                "current_value": str(int(gap_data.get("actual", 0))),
+                "target_value": str(int(gap_data.get("target", 0))),
+                "risk_level": "High" if gap_data.get("gap", 0) > 500 else "Medium" if gap_data.get("gap", 0) > 200 else "Low",
+                "impact": f"May miss {competency} competency target by {int(gap_data.get('gap', 0))} hours",
+                "mitigation": f"Prioritize {competency} courses in upcoming schedule"
+            })
+    
+    avg_registration_rate = learning_plan_analysis.get("avg_registration_rate", 0)
+    if avg_registration_rate < 0.8:
+        risk_factors.append({
+            "risk_area": "Registration Rate",
+            "current_value": f"{int(avg_registration_rate * 100)}%",
+            "target_value": "80%",
+            "risk_level": "High" if avg_registration_rate < 0.6 else "Medium",
+            "impact": "Low registration rates may lead to session cancellations and inefficient resource use",
+            "mitigation": "Improve communication and marketing of learning opportunities"
+        })
+    
+    avg_completion_rate = learning_plan_analysis.get("avg_completion_rate", 0)
+    if avg_completion_rate < 0.85:
+        risk_factors.append({
+            "risk_area": "Completion Rate",
+            "current_value": f"{int(avg_completion_rate * 100)}%",
+            "target_value": "85%",
+            "risk_level": "High" if avg_completion_rate < 0.7 else "Medium",
+            "impact": "Low completion rates reduce effective learning hours and competency development",
+            "mitigation": "Implement pre-session preparation and post-session follow-up"
+        })
+    
+    return risk_factors
+
+def _baseline_generate_diagnostic_report(gap_analysis, risk_assessment, opportunities):
+    strengths = []
+    if gap_analysis.get("vilt_gap_indicator", 0) == 0:
+        strengths.append("VILT delivery is on track to meet or exceed targets")
+    if gap_analysis.get("ilt_gap_indicator", 0) == 0:
+        strengths.append("ILT delivery is on track to meet or exceed targets")
+    for competency, gap_data in gap_analysis.get("competency_gaps", {}).items():
+        if gap_data.get("gap_indicator", 0) == 0:
+            strengths.append(f"{competency} competency development is on track to meet or exceed targets")
+    if not strengths:
+        strengths = [
+            "Strong foundation in technical training delivery",
+            "Effective learning content development capabilities",
+            "Established learning delivery infrastructure"
+        ]
+    
+    weaknesses = []
+    if gap_analysis.get("vilt_gap_indicator", 0) > 50:
+        weaknesses.append(f"Significant gap in VILT delivery ({gap_analysis.get('vilt_gap', 0)} sessions below target)")
+    if gap_analysis.get("ilt_gap_indicator", 0) > 20:
+        weaknesses.append(f"Significant gap in ILT delivery ({gap_analysis.get('ilt_gap', 0)} sessions below target)")
+    for competency, gap_data in gap_analysis.get("competency_gaps", {}).items():
+        if gap_data.get("gap_indicator", 0) > 200:
+            weaknesses.append(f"Significant gap in {competency} competency development ({int(gap_data.get('gap', 0))} hours below target)")
+    
+    high_risks = [risk for risk in risk_assessment if risk.get("risk_level") == "High"]
+    future_risks = [f"{risk.get('risk_area')}: {risk.get('impact')}" for risk in high_risks]
+    if len(future_risks) < 3:
+        additional_risks = [
+            "Increasing demand for specialized technical skills may outpace current learning delivery capacity",
+            "Evolving learning modalities may require significant updates to current delivery methods",
+            "Competition for learning time may reduce participation and completion rates"
+        ]
+        future_risks.extend(additional_risks[:3 - len(future_risks)])
+    
+    recommendations = [f"{opportunity.get('opportunity')} - {opportunity.get('impact')}" for opportunity in opportunities[:3]]
+    for risk in high_risks[:2]:
+        recommendations.append(f"Address {risk.get('risk_area')} risk through {risk.get('mitigation')}")
+    
+    # report_date is left out; it is the only field that depends on the clock
+    return {
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "future_risks": future_risks,
+        "recommendations": recommendations,
+        "summary": f"The learning plan is currently {'on track' if not weaknesses else 'at risk'} for meeting AOP targets. "
+                   f"{'Immediate action is required in the identified risk areas.' if weaknesses else 'Continue monitoring progress and implementing identified opportunities.'}"
+    }
+
+# Seeded plans, an empty input, and activities with missing or zero fields
+_PLAN_FIXTURES = [get_learning_plan_data(seed=seed) for seed in (0, 1, 2)] + [
+    [],
+    [{"gld_id": "GLD009", "gld_name": "No Activities", "department": "Operations"}],
+    [{
+        "gld_id": "GLD010",
+        "gld_name": "Sparse Plan",
+        "department": "Technology",
+        "activities": [
+            {"type": "VILT", "duration_hours": 2.0, "completion_count": 12, "capacity": 20, "registrations": 15},
+            {"type": "ILT", "competency_area": "Leadership", "capacity": 0, "registrations": 0},
+            {"type": "Workshop", "duration_hours": 1.5, "completion_count": 4, "competency_area": "Technical", "capacity": 10, "registrations": 5},
+            {}
+        ]
+    }]
+]
+
+def _pipeline(learning_plan_data, analyze, gap, risk):
+    """Run analysis, gap and risk steps with the given implementations"""
+    analysis = analyze(learning_plan_data, AOP_TARGETS)
+    gap_analysis = gap(analysis, AOP_TARGETS)
+    return analysis, gap_analysis, risk(gap_analysis, analysis)
+
+@pytest.mark.parametrize("learning_plan_data", _PLAN_FIXTURES)
+def test_analyze_learning_plan_matches_baseline(learning_plan_data):
+    _assert_close(
+        analyze_learning_plan.func(learning_plan_data, AOP_TARGETS),
+        _baseline_analyze_learning_plan(learning_plan_data, AOP_TARGETS)
+    )
+
+@pytest.mark.parametrize("learning_plan_data", _PLAN_FIXTURES)
+def test_assess_risk_matches_baseline(learning_plan_data):
+    analysis, gap_analysis, _ = _pipeline(learning_plan_data, _baseline_analyze_learning_plan, _baseline_calculate_gap, _baseline_assess_risk)
+    
+    assert assess_risk.func(gap_analysis, analysis) == _baseline_assess_risk(gap_analysis, analysis)
+
+@pytest.mark.parametrize("vilt_gap, ilt_gap, hours_gap, competency_gap, registration_rate, completion_rate", [
+    (0, 0, 0, 0, 0.8, 0.85),
+    (20, 10, 500, 200, 0.6, 0.7),
+    (21, 11, 501, 201, 0.59, 0.69),
+    (51, 21, 1001, 501, 0.0, 0.0),
+    (-5, -1, -100.5, -3.5, 1.0, 1.0)
+])
+def test_assess_risk_thresholds_match_baseline(vilt_gap, ilt_gap, hours_gap, competency_gap, registration_rate, completion_rate):
+    # Values on and either side of every risk threshold
+    gap_analysis = {
+        "vilt_scheduled": 100,
+        "vilt_gap": vilt_gap,
+        "ilt_scheduled": 40,
+        "ilt_gap": ilt_gap,
+        "learning_hours_scheduled": 2500.5,
+        "learning_hours_gap": hours_gap,
+        "competency_gaps": {
+            "Technical": {"target": 600, "actual": 600 - competency_gap, "gap": competency_gap},
+            "Ethics": {"target": 10}
+        }
+    }
+    analysis = {"avg_registration_rate": registration_rate, "avg_completion_rate": completion_rate}
+    
+    assert assess_risk.func(gap_analysis, analysis) == _baseline_assess_risk(gap_analysis, analysis)
+
+@pytest.mark.parametrize("learning_plan_data", _PLAN_FIXTURES)
+def test_generate_diagnostic_report_matches_baseline(learning_plan_data):
+    _, gap_analysis, risk_assessment = _pipeline(learning_plan_data, _baseline_analyze_learning_plan, _baseline_calculate_gap, _baseline_assess_risk)
+    opportunities = identify_opportunities.func(gap_analysis, risk_assessment, {})
+    
+    report = generate_diagnostic_report.func(gap_analysis, risk_assessment, opportunities)
+    
+    assert report.pop("report_date")
+    assert report == _baseline_generate_diagnostic_report(gap_analysis, risk_assessment, opportunities)
+
+@pytest.mark.parametrize("gap_analysis", [
+    {},
+    {"vilt_gap_indicator": 0, "ilt_gap_indicator": 0, "competency_gaps": {"Technical": {"gap_indicator": 0}}},
+    {
+        "vilt_gap_indicator": 51, "vilt_gap": 51, "ilt_gap_indicator": 21, "ilt_gap": 21,
+        "competency_gaps": {"Technical": {"gap_indicator": 201, "gap": 201.5}, "Leadership": {"gap_indicator": 200, "gap": 200}, "Ethics": {}}
+    }
+])
+def test_generate_diagnostic_report_classification_matches_baseline(gap_analysis):
+    risk_assessment = [
+        {"risk_area": "VILT Session Count", "risk_level": "High", "impact": "A", "mitigation": "B"},
+        {"risk_area": "Registration Rate", "risk_level": "Medium", "impact": "C", "mitigation": "D"},
+        {"risk_area": "Learning Hours", "risk_level": "High", "impact": "E", "mitigation": "F"},
+        {"risk_area": "Completion Rate", "risk_level": "High", "impact": "G", "mitigation": "H"}
+    ]
+    opportunities = [{"opportunity": f"Opportunity {i}", "impact": f"Impact {i}"} for i in range(4)]
+    
+    report = generate_diagnostic_report.func(gap_analysis, risk_assessment, opportunities)
+    report.pop("report_date")
+    
+    assert report == _baseline_generate_diagnostic_report(gap_analysis, risk_assessment, opportunities)
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_calculate_gap_matches_baseline(seed):
+    # "Ethics" has no scheduled hours, so its actual is missing
+    analysis = analyze_learning_plan.func(get_learning_plan_data(seed=seed), AOP_TARGETS)
+    
+    _assert_same(calculate_gap.func(analysis, AOP_TARGETS), _baseline_calculate_gap(analysis, AOP_TARGETS))
+
+@pytest.mark.parametrize("analysis", [
+    {},
+    {"competency_hours": {"Technical": 6000, "Leadership": 12.0}},
+    {"total_vilt_count": 600, "total_ilt_count": 10, "total_learning_hours": 10000.0, "competency_hours": {"Soft Skills": 12.5}}
+])
+def test_calculate_gap_keeps_value_types(analysis):
+    _assert_same(calculate_gap.func(analysis, AOP_TARGETS), _baseline_calculate_gap(analysis, AOP_TARGETS))
+
+def test_breakdown_returns_fresh_lists():
+    first = breakdown_targets.func(AOP_TARGETS)
+    first["quarterly"][0]["tasks"].append("Extra task")
+    first["daily"][0]["tasks"].clear()
+    first["monthly"][0]["competency_targets"]["Technical"] = 0
+    
+    second = breakdown_targets.func(AOP_TARGETS)
+    
+    assert all(type(period["tasks"]) is list for key in ("quarterly", "monthly", "weekly", "daily") for period in second[key])
+    assert "Extra task" not in second["quarterly"][0]["tasks"]
+    assert second["daily"][0]["tasks"]
+    assert second["monthly"][0]["competency_targets"]["Technical"] == pytest.approx(480)
@@ -7,9 +7,10 @@ These tools provide the core functionality for the agent system.
 """
 
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 import math
-import json
+import functools
+import numpy as np
 from crewai.tools import tool
 
 # Import data models
@@ -24,6 +25,68 @@ from .models import (
     GapAnalysis
 )
 
+# Distribution weights for the target breakdown
+_QUARTER_NAMES = ("Q1", "Q2", "Q3", "Q4")
+_QUARTER_WEIGHTS = np.array([0.25, 0.30, 0.25, 0.20])
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June", 
+                "July", "August", "September", "October", "November", "December")
+_MONTH_WEIGHTS = np.array([0.08, 0.08, 0.09, 0.09, 0.09, 0.12, 0.08, 0.08, 0.09, 0.08, 0.06, 0.06])
+_WEEK_NAMES = ("Week 1", "Week 2", "Week 3", "Week 4")
+# Assuming 4 weeks per month on average, using January as reference
+_WEEK_WEIGHTS = np.full(4, _MONTH_WEIGHTS[0] / 4)
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+
+# Task templates for each timeframe, copied into fresh lists on every call;
+# only the monthly session counts vary per call
+_QUARTER_TASKS = {
+    quarter: (
+        f"Plan {quarter} VILT and ILT schedule",
+        f"Allocate resources for {quarter} training delivery",
+        f"Set up tracking for {quarter} learning metrics"
+    )
+    for quarter in _QUARTER_NAMES
+}
+_MONTHLY_VILT_TASK = "Schedule {n} VILT sessions"
+_MONTHLY_ILT_TASK = "Schedule {n} ILT sessions"
+_MONTHLY_STATIC_TASKS = (
+    "Monitor registration and completion rates",
+    "Adjust schedule based on demand and feedback"
+)
+_WEEKLY_TASKS = {
+    week: (
+        f"Confirm trainers for {week} sessions",
+        "Send reminders to registered participants",
+        "Prepare training materials and environments",
+        "Review feedback from previous week's sessions"
+    )
+    for week in _WEEK_NAMES
+}
+_DAILY_TASKS = {
+    day: (
+        f"Review {day}'s scheduled sessions",
+        "Check registration numbers for upcoming sessions",
+        "Follow up on participant feedback",
+        "Update tracking dashboards",
+        "Coordinate with trainers and support staff"
+    )
+    for day in _DAY_NAMES
+}
+
+def _weighted_targets(annual_targets: Dict[str, Any], weights: np.ndarray):
+    """Scale every annual target by each period weight in one outer product.
+
+    Yields ``(vilt, ilt, learning_hours, competency_targets)`` per period.
+    """
+    competencies = annual_targets["competency_targets"]
+    values = np.array([
+        annual_targets["vilt_target"],
+        annual_targets["ilt_target"],
+        annual_targets["learning_hours_target"],
+        *competencies.values()
+    ], dtype=np.float64)
+    for row in np.outer(weights, values).tolist():
+        yield row[0], row[1], row[2], dict(zip(competencies, row[3:]))
+
 @tool("Break down AOP targets into timeframes")
 def breakdown_targets(aop_targets: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -35,7 +98,6 @@ def breakdown_targets(aop_targets: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with target breakdowns for different timeframes
     """
-    # Convert input to AOPTarget model
     annual_targets = {
         "vilt_target": aop_targets.get("vilt_target", 0),
         "ilt_target": aop_targets.get("ilt_target", 0),
@@ -44,84 +106,50 @@ def breakdown_targets(aop_targets: Dict[str, Any]) -> Dict[str, Any]:
     }
     
     # Create quarterly breakdown (distribution weights by quarter)
-    quarterly_weights = [0.25, 0.30, 0.25, 0.20]  # Q1, Q2, Q3, Q4
-    quarterly_breakdown = []
-    
-    for i, weight in enumerate(quarterly_weights):
-        quarter = f"Q{i+1}"
-        quarterly_targets = {
+    quarterly_breakdown = [
+        {
             "timeframe_name": quarter,
-            "vilt_target": annual_targets["vilt_target"] * weight,
-            "ilt_target": annual_targets["ilt_target"] * weight,
-            "learning_hours_target": annual_targets["learning_hours_target"] * weight,
-            "competency_targets": {k: v * weight for k, v in annual_targets["competency_targets"].items()},
-            "tasks": [
-                f"Plan {quarter} VILT and ILT schedule",
-                f"Allocate resources for {quarter} training delivery",
-                f"Set up tracking for {quarter} learning metrics"
-            ]
+            "vilt_target": vilt,
+            "ilt_target": ilt,
+            "learning_hours_target": hours,
+            "competency_targets": competencies,
+            "tasks": list(_QUARTER_TASKS[quarter])
         }
-        quarterly_breakdown.append(quarterly_targets)
+        for quarter, (vilt, ilt, hours, competencies) in zip(_QUARTER_NAMES, _weighted_targets(annual_targets, _QUARTER_WEIGHTS))
+    ]
     
     # Create monthly breakdown (12 months)
-    monthly_weights = [0.08, 0.08, 0.09, 0.09, 0.09, 0.12, 0.08, 0.08, 0.09, 0.08, 0.06, 0.06]  # Jan-Dec
-    months = ["January", "February", "March", "April", "May", "June", 
-              "July", "August", "September", "October", "November", "December"]
-    monthly_breakdown = []
-    
-    for i, (month, weight) in enumerate(zip(months, monthly_weights)):
-        monthly_targets = {
+    monthly_breakdown = [
+        {
             "timeframe_name": month,
-            "vilt_target": annual_targets["vilt_target"] * weight,
-            "ilt_target": annual_targets["ilt_target"] * weight,
-            "learning_hours_target": annual_targets["learning_hours_target"] * weight,
-            "competency_targets": {k: v * weight for k, v in annual_targets["competency_targets"].items()},
+            "vilt_target": vilt,
+            "ilt_target": ilt,
+            "learning_hours_target": hours,
+            "competency_targets": competencies,
             "tasks": [
-                f"Schedule {math.ceil(annual_targets['vilt_target'] * weight)} VILT sessions",
-                f"Schedule {math.ceil(annual_targets['ilt_target'] * weight)} ILT sessions",
-                f"Monitor registration and completion rates",
-                f"Adjust schedule based on demand and feedback"
+                _MONTHLY_VILT_TASK.format(n=math.ceil(vilt)),
+                _MONTHLY_ILT_TASK.format(n=math.ceil(ilt)),
+                *_MONTHLY_STATIC_TASKS
             ]
         }
-        monthly_breakdown.append(monthly_targets)
+        for month, (vilt, ilt, hours, competencies) in zip(_MONTH_NAMES, _weighted_targets(annual_targets, _MONTH_WEIGHTS))
+    ]
     
     # Create weekly breakdown (sample for 4 weeks)
-    weekly_breakdown = []
-    for i in range(1, 5):
-        week = f"Week {i}"
-        # Assuming 4 weeks per month on average
-        weekly_weight = monthly_weights[0] / 4  # Using January as reference
-        weekly_targets = {
+    weekly_breakdown = [
+        {
             "timeframe_name": week,
-            "vilt_target": annual_targets["vilt_target"] * weekly_weight,
-            "ilt_target": annual_targets["ilt_target"] * weekly_weight,
-            "learning_hours_target": annual_targets["learning_hours_target"] * weekly_weight,
-            "competency_targets": {k: v * weekly_weight for k, v in annual_targets["competency_targets"].items()},
-            "tasks": [
-                f"Confirm trainers for {week} sessions",
-                f"Send reminders to registered participants",
-                f"Prepare training materials and environments",
-                f"Review feedback from previous week's sessions"
-            ]
+            "vilt_target": vilt,
+            "ilt_target": ilt,
+            "learning_hours_target": hours,
+            "competency_targets": competencies,
+            "tasks": list(_WEEKLY_TASKS[week])
         }
-        weekly_breakdown.append(weekly_targets)
+        for week, (vilt, ilt, hours, competencies) in zip(_WEEK_NAMES, _weighted_targets(annual_targets, _WEEK_WEIGHTS))
+    ]
     
     # Create daily to-do lists (sample for 5 days)
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-    daily_breakdown = []
-    
-    for day in days:
-        daily_tasks = {
-            "day": day,
-            "tasks": [
-                f"Review {day}'s scheduled sessions",
-                f"Check registration numbers for upcoming sessions",
-                f"Follow up on participant feedback",
-                f"Update tracking dashboards",
-                f"Coordinate with trainers and support staff"
-            ]
-        }
-        daily_breakdown.append(daily_tasks)
+    daily_breakdown = [{"day": day, "tasks": list(tasks)} for day, tasks in _DAILY_TASKS.items()]
     
     # Combine all breakdowns
     return {
@@ -132,6 +160,62 @@ def breakdown_targets(aop_targets: Dict[str, Any]) -> Dict[str, Any]:
         "daily": daily_breakdown
     }
 
+# Activity type codes used by the aggregation
+_ACTIVITY_TYPE_CODES = {"VILT": 0, "ILT": 1}
+# One record per activity, laid out for column-wise aggregation
+_ACTIVITY_DTYPE = np.dtype([
+    ("type", "i1"),
+    ("duration", "f8"),
+    ("completions", "f8"),
+    ("capacity", "f8"),
+    ("registrations", "f8"),
+    ("competency", "i8"),
+    ("plan", "i8")
+])
+
+def _flatten_plans(learning_plan_data: List[Dict[str, Any]]):
+    """Flatten all plan activities into a structured NumPy array.
+
+    Competency areas are mapped to integer ids (in order of first appearance)
+    so that their hours can be accumulated column-wise. Each record also
+    carries the index of its plan for the per-GLD counts.
+    """
+    records = []
+    competency_index = {}
+    for plan_index, plan in enumerate(learning_plan_data):
+        for activity in plan.get("activities", []):
+            competency = activity.get("competency_area")
+            records.append((
+                _ACTIVITY_TYPE_CODES.get(activity.get("type"), -1),
+                activity.get("duration_hours", 0),
+                activity.get("completion_count", 0),
+                activity.get("capacity", 0),
+                activity.get("registrations", 0),
+                competency_index.setdefault(competency, len(competency_index)) if competency else -1,
+                plan_index
+            ))
+    
+    return np.array(records, dtype=_ACTIVITY_DTYPE), list(competency_index)
+
+def _aggregate(types, durations, completions, capacities, registrations, competency_ids, n_competencies):
+    """Sum counts, learning hours and rates over the flattened activities"""
+    hours = durations * completions
+    has_competency = competency_ids >= 0
+    competency_hours = np.bincount(competency_ids[has_competency], weights=hours[has_competency], minlength=n_competencies)
+    
+    has_capacity = capacities > 0
+    has_registrations = registrations > 0
+    return (
+        int((types == 0).sum()),
+        int((types == 1).sum()),
+        float(hours.sum()),
+        float((registrations[has_capacity] / capacities[has_capacity]).sum()),
+        int(has_capacity.sum()),
+        float((completions[has_registrations] / registrations[has_registrations]).sum()),
+        int(has_registrations.sum()),
+        competency_hours
+    )
+
 @tool("Analyze learning plan to track VILTs and ILTs")
 def analyze_learning_plan(learning_plan_data: Dict[str, Any], aop_targets: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -144,51 +228,46 @@ def analyze_learning_plan(learning_plan_data: Dict[str, Any], aop_targets: Dict[
     Returns:
         Analysis of the learning plan with counts and metrics
     """
-    # Process learning plan data
-    total_vilt_count = 0
-    total_ilt_count = 0
-    total_learning_hours = 0
-    competency_hours = {}
-    
-    # Aggregate data across all GLDs
-    for plan in learning_plan_data:
-        # Count VILT and ILT sessions
-        for activity in plan.get("activities", []):
-            if activity.get("type") == "VILT":
-                total_vilt_count += 1
-            elif activity.get("type") == "ILT":
-                total_ilt_count += 1
-            
-            # Calculate learning hours
-            duration = activity.get("duration_hours", 0)
-            completions = activity.get("completion_count", 0)
-            hours = duration * completions
-            total_learning_hours += hours
-            
-            # Aggregate by competency area
-            competency = activity.get("competency_area")
-            if competency:
-                if competency in competency_hours:
-                    competency_hours[competency] += hours
-                else:
-                    competency_hours[competency] = hours
-    
-    # Calculate registration and completion metrics
-    registration_rates = []
-    completion_rates = []
-    for plan in learning_plan_data:
-        for activity in plan.get("activities", []):
-            capacity = activity.get("capacity", 0)
-            registrations = activity.get("registrations", 0)
-            completions = activity.get("completion_count", 0)
-            
-            if capacity > 0:
-                registration_rates.append(registrations / capacity)
-            if registrations > 0:
-                completion_rates.append(completions / registrations)
-    
-    avg_registration_rate = sum(registration_rates) / len(registration_rates) if registration_rates else 0
-    avg_completion_rate = sum(completion_rates) / len(completion_rates) if completion_rates else 0
+    # Flatten the plans once and aggregate the activity columns with NumPy
+    activities, competency_names = _flatten_plans(learning_plan_data)
+    (
+        total_vilt_count,
+        total_ilt_count,
+        total_learning_hours,
+        sum_registration_rate,
+        registration_rate_count,
+        sum_completion_rate,
+        completion_rate_count,
+        hours_by_competency
+    ) = _aggregate(
+        activities["type"],
+        activities["duration"],
+        activities["completions"],
+        activities["capacity"],
+        activities["registrations"],
+        activities["competency"],
+        len(competency_names)
+    )
+    competency_hours = dict(zip(competency_names, hours_by_competency.tolist()))
+    
+    avg_registration_rate = sum_registration_rate / registration_rate_count if registration_rate_count else 0
+    avg_completion_rate = sum_completion_rate / completion_rate_count if completion_rate_count else 0
+    
+    # Add per-GLD breakdown, counting each plan's sessions from the type column
+    types = activities["type"]
+    plan_ids = activities["plan"]
+    gld_vilt_counts = np.bincount(plan_ids[types == 0], minlength=len(learning_plan_data)).tolist()
+    gld_ilt_counts = np.bincount(plan_ids[types == 1], minlength=len(learning_plan_data)).tolist()
+    gld_breakdown = [
+        {
+            "gld_id": plan.get("gld_id"),
+            "gld_name": plan.get("gld_name"),
+            "department": plan.get("department"),
+            "vilt_count": gld_vilt_count,
+            "ilt_count": gld_ilt_count
+        }
+        for plan, gld_vilt_count, gld_ilt_count in zip(learning_plan_data, gld_vilt_counts, gld_ilt_counts)
+    ]
     
     # Prepare analysis results
     analysis = {
@@ -198,23 +277,9 @@ def analyze_learning_plan(learning_plan_data: Dict[str, Any], aop_targets: Dict[
         "competency_hours": competency_hours,
         "avg_registration_rate": avg_registration_rate,
         "avg_completion_rate": avg_completion_rate,
-        "gld_breakdown": []
+        "gld_breakdown": gld_breakdown
     }
     
-    # Add per-GLD breakdown
-    for plan in learning_plan_data:
-        gld_vilt_count = sum(1 for activity in plan.get("activities", []) if activity.get("type") == "VILT")
-        gld_ilt_count = sum(1 for activity in plan.get("activities", []) if activity.get("type") == "ILT")
-        
-        gld_analysis = {
-            "gld_id": plan.get("gld_id"),
-            "gld_name": plan.get("gld_name"),
-            "department": plan.get("department"),
-            "vilt_count": gld_vilt_count,
-            "ilt_count": gld_ilt_count
-        }
-        analysis["gld_breakdown"].append(gld_analysis)
-    
     return analysis
 
 @tool("Calculate gap between targets and current plan")
@@ -251,19 +316,25 @@ def calculate_gap(learning_plan_analysis: Dict[str, Any], aop_targets: Dict[str,
     ilt_gap_indicator = 0 if ilt_scheduled >= ilt_target else ilt_gap
     learning_hours_gap_indicator = 0 if learning_hours_scheduled >= learning_hours_target else learning_hours_gap
     
-    # Calculate competency gaps
-    competency_gaps = {}
-    for competency, target in competency_targets.items():
-        actual = competency_hours.get(competency, 0)
-        gap = target - actual
-        gap_indicator = 0 if actual >= target else gap
-        
-        competency_gaps[competency] = {
+    # Calculate competency gaps over aligned target/actual arrays. Object
+    # arrays keep each value's Python type, so int targets, a missing actual
+    # of 0 and the 0 (No Gap) indicator come back as ints, not floats
+    competencies = list(competency_targets)
+    targets = np.array([competency_targets[competency] for competency in competencies], dtype=object)
+    actuals = np.array([competency_hours.get(competency, 0) for competency in competencies], dtype=object)
+    gaps = targets - actuals
+    gap_indicators = np.where(actuals >= targets, 0, gaps)
+    competency_gaps = {
+        competency: {
             "target": target,
             "actual": actual,
             "gap": gap,
             "gap_indicator": gap_indicator
         }
+        for competency, target, actual, gap, gap_indicator in zip(
+            competencies, targets.tolist(), actuals.tolist(), gaps.tolist(), gap_indicators.tolist()
+        )
+    }
     
     # Create gap analysis result
     gap_analysis = {
@@ -281,6 +352,13 @@ def calculate_gap(learning_plan_analysis: Dict[str, Any], aop_targets: Dict[str,
     
     return gap_analysis
 
+# Risk levels indexed by the number of thresholds a gap exceeds
+_RISK_LEVELS = np.array(["Low", "Medium", "High"])
+# (medium, high) gap thresholds for VILT sessions, ILT sessions and learning hours
+_GAP_RISK_THRESHOLDS = np.array([[20, 50], [10, 20], [500, 1000]], dtype=np.float64)
+# (medium, high) gap thresholds for competency hours
+_COMPETENCY_RISK_THRESHOLDS = np.array([200, 500], dtype=np.float64)
+
 @tool("Assess risk factors in learning plan execution")
 def assess_risk(gap_analysis: Dict[str, Any], learning_plan_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -296,58 +374,68 @@ def assess_risk(gap_analysis: Dict[str, Any], learning_plan_analysis: Dict[str,
     """
     risk_factors = []
     
-    # Check VILT gap
     vilt_gap = gap_analysis.get("vilt_gap", 0)
+    ilt_gap = gap_analysis.get("ilt_gap", 0)
+    learning_hours_gap = gap_analysis.get("learning_hours_gap", 0)
+    competency_gaps = gap_analysis.get("competency_gaps", {})
+    
+    # Classify every gap against its (medium, high) thresholds in one pass
+    gaps = np.array(
+        [vilt_gap, ilt_gap, learning_hours_gap, *(gap_data.get("gap", 0) for gap_data in competency_gaps.values())],
+        dtype=np.float64
+    )
+    thresholds = np.vstack([_GAP_RISK_THRESHOLDS, np.tile(_COMPETENCY_RISK_THRESHOLDS, (len(competency_gaps), 1))])
+    risk_levels = _RISK_LEVELS[(gaps[:, None] > thresholds).sum(axis=1)].tolist()
+    
+    # Check VILT gap
     if vilt_gap > 0:
         vilt_risk = {
             "risk_area": "VILT Session Count",
             "current_value": str(gap_analysis.get("vilt_scheduled", 0)),
             "target_value": str(gap_analysis.get("vilt_scheduled", 0) + vilt_gap),
-            "risk_level": "High" if vilt_gap > 50 else "Medium" if vilt_gap > 20 else "Low",
+            "risk_level": risk_levels[0],
             "impact": f"May miss VILT target by {vilt_gap} sessions",
             "mitigation": "Schedule additional VILT sessions, prioritizing high-impact courses"
         }
         risk_factors.append(vilt_risk)
     
     # Check ILT gap
-    ilt_gap = gap_analysis.get("ilt_gap", 0)
     if ilt_gap > 0:
         ilt_risk = {
             "risk_area": "ILT Session Count",
             "current_value": str(gap_analysis.get("ilt_scheduled", 0)),
             "target_value": str(gap_analysis.get("ilt_scheduled", 0) + ilt_gap),
-            "risk_level": "High" if ilt_gap > 20 else "Medium" if ilt_gap > 10 else "Low",
+            "risk_level": risk_levels[1],
             "impact": f"May miss ILT target by {ilt_gap} sessions",
             "mitigation": "Schedule additional ILT sessions, consider converting some to VILT format"
         }
         risk_factors.append(ilt_risk)
     
     # Check learning hours gap
-    learning_hours_gap = gap_analysis.get("learning_hours_gap", 0)
     if learning_hours_gap > 0:
         hours_risk = {
             "risk_area": "Learning Hours",
             "current_value": str(int(gap_analysis.get("learning_hours_scheduled", 0))),
             "target_value": str(int(gap_analysis.get("learning_hours_scheduled", 0) + learning_hours_gap)),
-            "risk_level": "High" if learning_hours_gap > 1000 else "Medium" if learning_hours_gap > 500 else "Low",
+            "risk_level": risk_levels[2],
             "impact": f"May miss learning hours target by {int(learning_hours_gap)} hours",
             "mitigation": "Increase session capacity and promote registration"
         }
         risk_factors.append(hours_risk)
     
     # Check competency gaps
-    competency_gaps = gap_analysis.get("competency_gaps", {})
-    for competency, gap_data in competency_gaps.items():
-        if gap_data.get("gap", 0) > 0:
-            competency_risk = {
-                "risk_area": f"{competency} Competency",
-                "current_value": str(int(gap_data.get("actual", 0))),
-                "target_value": str(int(gap_data.get("target", 0))),
-                "risk_level": "High" if gap_data.get("gap", 0) > 500 else "Medium" if gap_data.get("gap", 0) > 200 else "Low",
-                "impact": f"May miss {competency} competency target by {int(gap_data.get('gap', 0))} hours",
-                "mitigation": f"Prioritize {competency} courses in upcoming schedule"
-            }
-            risk_factors.append(competency_risk)
+    risk_factors.extend(
+        {
+            "risk_area": f"{competency} Competency",
+            "current_value": str(int(gap_data.get("actual", 0))),
+            "target_value": str(int(gap_data.get("target", 0))),
+            "risk_level": risk_level,
+            "impact": f"May miss {competency} competency target by {int(gap_data.get('gap', 0))} hours",
+            "mitigation": f"Prioritize {competency} courses in upcoming schedule"
+        }
+        for (competency, gap_data), risk_level in zip(competency_gaps.items(), risk_levels[3:])
+        if gap_data.get("gap", 0) > 0
+    )
     
     # Check registration rate
     avg_registration_rate = learning_plan_analysis.get("avg_registration_rate", 0)
@@ -460,6 +548,27 @@ def identify_opportunities(gap_analysis: Dict[str, Any], risk_assessment: List[D
     
     return opportunities
 
+@functools.lru_cache(maxsize=1)
+def _format_day(day: date) -> str:
+    """ISO-format a day, reusing the string until the date changes"""
+    return day.isoformat()
+
+def _today_str() -> str:
+    """Today's date as YYYY-MM-DD"""
+    return _format_day(date.today())
+
+# Fallback report entries when the analysis yields too few of its own
+_GENERIC_STRENGTHS = (
+    "Strong foundation in technical training delivery",
+    "Effective learning content development capabilities",
+    "Established learning delivery infrastructure"
+)
+_GENERIC_FUTURE_RISKS = (
+    "Increasing demand for specialized technical skills may outpace current learning delivery capacity",
+    "Evolving learning modalities may require significant updates to current delivery methods",
+    "Competition for learning time may reduce participation and completion rates"
+)
+
 @tool("Generate diagnostic reports for Leaders and TD")
 def generate_diagnostic_report(gap_analysis: Dict[str, Any], risk_assessment: List[Dict[str, Any]], 
                              opportunities: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -474,55 +583,45 @@ def generate_diagnostic_report(gap_analysis: Dict[str, Any], risk_assessment: Li
     Returns:
         Comprehensive diagnostic report with actionable insights
     """
+    vilt_gap_indicator = gap_analysis.get("vilt_gap_indicator", 0)
+    ilt_gap_indicator = gap_analysis.get("ilt_gap_indicator", 0)
+    
+    # Classify every competency as a strength or weakness in one pass
+    competency_strengths = []
+    competency_weaknesses = []
+    for competency, gap_data in gap_analysis.get("competency_gaps", {}).items():
+        gap_indicator = gap_data.get("gap_indicator", 0)
+        if gap_indicator == 0:
+            competency_strengths.append(f"{competency} competency development is on track to meet or exceed targets")
+        elif gap_indicator > 200:
+            competency_weaknesses.append(f"Significant gap in {competency} competency development ({int(gap_data.get('gap', 0))} hours below target)")
+    
     # Identify strengths (areas with no gap or exceeding targets)
     strengths = []
-    
-    if gap_analysis.get("vilt_gap_indicator", 0) == 0:
+    if vilt_gap_indicator == 0:
         strengths.append("VILT delivery is on track to meet or exceed targets")
-    
-    if gap_analysis.get("ilt_gap_indicator", 0) == 0:
+    if ilt_gap_indicator == 0:
         strengths.append("ILT delivery is on track to meet or exceed targets")
-    
-    for competency, gap_data in gap_analysis.get("competency_gaps", {}).items():
-        if gap_data.get("gap_indicator", 0) == 0:
-            strengths.append(f"{competency} competency development is on track to meet or exceed targets")
+    strengths += competency_strengths
     
     # If we don't have any identified strengths, add some generic ones
     if not strengths:
-        strengths = [
-            "Strong foundation in technical training delivery",
-            "Effective learning content development capabilities",
-            "Established learning delivery infrastructure"
-        ]
+        strengths = list(_GENERIC_STRENGTHS)
     
     # Identify weaknesses (areas with significant gaps)
     weaknesses = []
-    
-    if gap_analysis.get("vilt_gap_indicator", 0) > 50:
+    if vilt_gap_indicator > 50:
         weaknesses.append(f"Significant gap in VILT delivery ({gap_analysis.get('vilt_gap', 0)} sessions below target)")
-    
-    if gap_analysis.get("ilt_gap_indicator", 0) > 20:
+    if ilt_gap_indicator > 20:
         weaknesses.append(f"Significant gap in ILT delivery ({gap_analysis.get('ilt_gap', 0)} sessions below target)")
-    
-    for competency, gap_data in gap_analysis.get("competency_gaps", {}).items():
-        if gap_data.get("gap_indicator", 0) > 200:
-            weaknesses.append(f"Significant gap in {competency} competency development ({int(gap_data.get('gap', 0))} hours below target)")
+    weaknesses += competency_weaknesses
     
     # Extract high-risk areas
     high_risks = [risk for risk in risk_assessment if risk.get("risk_level") == "High"]
-    future_risks = []
-    
-    for risk in high_risks:
-        future_risks.append(f"{risk.get('risk_area')}: {risk.get('impact')}")
+    future_risks = [f"{risk.get('risk_area')}: {risk.get('impact')}" for risk in high_risks]
     
     # Add some generic future risks if we don't have enough
-    if len(future_risks) < 3:
-        additional_risks = [
-            "Increasing demand for specialized technical skills may outpace current learning delivery capacity",
-            "Evolving learning modalities may require significant updates to current delivery methods",
-            "Competition for learning time may reduce participation and completion rates"
-        ]
-        future_risks.extend(additional_risks[:3 - len(future_risks)])
+    future_risks += _GENERIC_FUTURE_RISKS[:max(0, 3 - len(future_risks))]
     
     # Generate recommendations based on opportunities and risks
     recommendations = []
@@ -536,7 +635,7 @@ def generate_diagnostic_report(gap_analysis: Dict[str, Any], risk_assessment: Li
     
     # Create the diagnostic report
     diagnostic_report = {
-        "report_date": datetime.now().strftime("%Y-%m-%d"),
+        "report_date": _today_str(),
         "strengths": strengths,
         "weaknesses": weaknesses,
         "future_risks": future_risks,